@@ -12,7 +12,13 @@ Date: October 10, 2025
 import dearpygui.dearpygui as dpg
 import sys
 import argparse
+import bisect
+import csv
+import functools
+import logging
+import re
 from typing import Dict, Optional, Callable, Union
+from collections import deque
 from datetime import datetime
 import threading
 import os
@@ -20,6 +26,33 @@ import time
 from pathlib import Path
 import json
 
+# Debug logging stays silent (and unformatted) unless DEBUG is enabled
+log = logging.getLogger("cantool_gui")
+
+# Matches the "Device N: Description" (or bare "Device N") combo labels
+_DEVICE_RE = re.compile(r'^Device\s+(\d+)')
+
+# Monitor color scales: a value's bucket is found with one binary search
+# against the thresholds, indexing the parallel color tuple
+_TEMP_THRESHOLDS = (-50, 0, 25, 50, 85)
+_TEMP_COLORS = (
+    (120, 160, 255),  # Very cold - blue
+    (140, 200, 255),  # Cold - light blue
+    (120, 220, 150),  # Normal - soft green
+    (240, 220, 120),  # Warm - yellow
+    (255, 180, 100),  # Hot - orange
+    (255, 120, 120),  # Very hot - soft red
+)
+_VOLT_THRESHOLDS = (2.5, 3.0, 3.3, 4.2, 4.3)
+_VOLT_COLORS = (
+    (255, 0, 0),      # Critical low - bright red
+    (255, 100, 100),  # Very low - red
+    (255, 200, 100),  # Low - orange
+    (100, 255, 100),  # Normal - green
+    (255, 255, 100),  # High - yellow
+    (255, 100, 255),  # Very high - magenta
+)
+
 # Import both drivers
 try:
     from drivers.PCAN_Driver import PCANDriver, PCANChannel, PCANBaudRate, CANMessage as PCANMessage
@@ -40,6 +73,12 @@ if not PCAN_AVAILABLE and not CANABLE_AVAILABLE:
     print("Please ensure PCAN_Driver.py or CANable_Driver.py exists in drivers/ directory")
     sys.exit(1)
 
+# Dropdown item lists are fixed at runtime - build them once at import
+# instead of re-running enum comprehensions on every combo rebuild
+PCAN_CHANNEL_ITEMS = [channel.name for channel in PCANChannel] if PCAN_AVAILABLE else []
+PCAN_BAUDRATE_ITEMS = [br.name for br in PCANBaudRate] if PCAN_AVAILABLE else []
+CANABLE_BAUDRATE_ITEMS = [br.name for br in CANableBaudRate] if CANABLE_AVAILABLE else []
+
 # Optional: DBC file support
 try:
     import cantools
@@ -49,6 +88,159 @@ except ImportError:
     print("Warning: cantools not installed. DBC file support disabled.")
     print("Install with: pip install cantools")
 
+# Optional: orjson for faster config I/O (falls back to stdlib json)
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=8)
+def _load_dbc_cached(file_path: str, mtime: float):
+    """Parse a DBC file, memoized on (path, mtime).
+
+    Parsing a large DBC with cantools is expensive, so repeated loads of the
+    same unmodified file (startup auto-load, user re-selecting the same file)
+    return the already-parsed database instantly. Including the file's mtime
+    in the key means an edited DBC is re-parsed automatically.
+    """
+    # Load with strict=False to allow extended 29-bit CAN IDs without validation errors
+    return cantools.database.load_file(file_path, strict=False)
+
+
+def _hex_str(data) -> str:
+    """Format CAN payload bytes as uppercase space-separated hex.
+
+    bytes.hex(' ') does the per-byte formatting in a single C call instead
+    of a Python-level loop with one f-string per byte.
+    """
+    return bytes(data).hex(' ').upper()
+
+
+def _signal_formatter(sig) -> Callable:
+    """Build a value -> (value_str, unit_str) callable for one DBC signal.
+
+    The choices/scale branching is evaluated once per signal at DBC load
+    time instead of once per signal per frame, so the decode hot path
+    just calls the prebuilt formatter.
+    """
+    unit = sig.unit if sig.unit else ""
+    # Precision ladder matches the signal's scale
+    if sig.scale >= 1.0:
+        num_fmt = "{:.1f}".format
+    elif sig.scale >= 0.01:
+        num_fmt = "{:.2f}".format
+    else:
+        num_fmt = "{:.3f}".format
+
+    if sig.choices:
+        choices = sig.choices
+
+        def fmt(value):
+            # Explicit type checks instead of a try/except: decoded
+            # values are ints or floats here, so the exception machinery
+            # never needs to be on the hot path
+            if type(value) is int:
+                v = value
+            elif isinstance(value, (int, float)):
+                v = int(value)
+            else:
+                v = None
+            if v is not None:
+                choice_name = choices.get(v)
+                if choice_name:
+                    return (choice_name, "")
+            if isinstance(value, float):
+                return (num_fmt(value), unit)
+            return (str(value), unit)
+        return fmt
+
+    def fmt(value):
+        if isinstance(value, float):
+            return (num_fmt(value), unit)
+        return (str(value), unit)
+    return fmt
+
+
+# Global DPG theme data. Declaring the palette as plain tuples keeps the
+# theme in one place and lets the built theme object be cached on the
+# class, so repeat setup paths bind the existing theme instead of
+# re-issuing every add_theme_color call.
+_THEME_COLORS = (
+    # Modern dark theme with cyan/purple gradient accents
+    (dpg.mvThemeCol_WindowBg, (18, 18, 24, 255)),
+    (dpg.mvThemeCol_ChildBg, (24, 24, 32, 255)),
+    (dpg.mvThemeCol_Border, (80, 70, 120, 180)),
+    (dpg.mvThemeCol_FrameBg, (35, 35, 48, 255)),
+    (dpg.mvThemeCol_FrameBgHovered, (50, 50, 68, 255)),
+    (dpg.mvThemeCol_FrameBgActive, (65, 60, 85, 255)),
+    (dpg.mvThemeCol_TitleBg, (25, 25, 40, 255)),
+    (dpg.mvThemeCol_TitleBgActive, (40, 35, 60, 255)),
+    (dpg.mvThemeCol_TitleBgCollapsed, (20, 20, 35, 255)),
+    (dpg.mvThemeCol_MenuBarBg, (25, 25, 40, 255)),
+    (dpg.mvThemeCol_ScrollbarBg, (24, 24, 32, 255)),
+    (dpg.mvThemeCol_ScrollbarGrab, (100, 80, 140, 255)),
+    (dpg.mvThemeCol_ScrollbarGrabHovered, (120, 100, 160, 255)),
+    (dpg.mvThemeCol_ScrollbarGrabActive, (140, 120, 180, 255)),
+    (dpg.mvThemeCol_CheckMark, (100, 200, 255, 255)),
+    (dpg.mvThemeCol_SliderGrab, (100, 180, 255, 255)),
+    (dpg.mvThemeCol_SliderGrabActive, (120, 200, 255, 255)),
+    # Vibrant gradient buttons (cyan to purple)
+    (dpg.mvThemeCol_Button, (70, 100, 180, 255)),
+    (dpg.mvThemeCol_ButtonHovered, (90, 130, 220, 255)),
+    (dpg.mvThemeCol_ButtonActive, (110, 150, 240, 255)),
+    # Headers with purple tint
+    (dpg.mvThemeCol_Header, (80, 60, 140, 255)),
+    (dpg.mvThemeCol_HeaderHovered, (100, 80, 170, 255)),
+    (dpg.mvThemeCol_HeaderActive, (120, 100, 190, 255)),
+    # Separators with gradient feel
+    (dpg.mvThemeCol_Separator, (90, 80, 130, 200)),
+    (dpg.mvThemeCol_SeparatorHovered, (120, 100, 160, 255)),
+    (dpg.mvThemeCol_SeparatorActive, (140, 120, 180, 255)),
+    (dpg.mvThemeCol_ResizeGrip, (80, 100, 180, 200)),
+    (dpg.mvThemeCol_ResizeGripHovered, (100, 130, 220, 255)),
+    (dpg.mvThemeCol_ResizeGripActive, (120, 150, 240, 255)),
+    # Tabs with gradient colors
+    (dpg.mvThemeCol_Tab, (50, 50, 85, 255)),
+    (dpg.mvThemeCol_TabHovered, (90, 120, 200, 255)),
+    (dpg.mvThemeCol_TabActive, (70, 100, 180, 255)),
+    (dpg.mvThemeCol_TabUnfocused, (35, 35, 60, 255)),
+    (dpg.mvThemeCol_TabUnfocusedActive, (50, 50, 85, 255)),
+    # Table colors with better contrast
+    (dpg.mvThemeCol_TableHeaderBg, (45, 45, 75, 255)),
+    (dpg.mvThemeCol_TableBorderStrong, (90, 80, 130, 255)),
+    (dpg.mvThemeCol_TableBorderLight, (60, 55, 85, 255)),
+    (dpg.mvThemeCol_TableRowBg, (0, 0, 0, 0)),
+    (dpg.mvThemeCol_TableRowBgAlt, (100, 90, 140, 15)),
+    # Text colors with better readability
+    (dpg.mvThemeCol_Text, (240, 240, 250, 255)),
+    (dpg.mvThemeCol_TextDisabled, (140, 140, 160, 255)),
+    (dpg.mvThemeCol_PopupBg, (30, 30, 48, 245)),
+)
+
+# Enhanced style adjustments for modern look
+_THEME_STYLES = (
+    (dpg.mvStyleVar_FrameRounding, (8,)),
+    (dpg.mvStyleVar_WindowRounding, (10,)),
+    (dpg.mvStyleVar_ChildRounding, (8,)),
+    (dpg.mvStyleVar_FramePadding, (10, 8)),
+    (dpg.mvStyleVar_ItemSpacing, (10, 8)),
+    (dpg.mvStyleVar_IndentSpacing, (22,)),
+    (dpg.mvStyleVar_ScrollbarSize, (16,)),
+    (dpg.mvStyleVar_ScrollbarRounding, (8,)),
+    (dpg.mvStyleVar_GrabMinSize, (14,)),
+    (dpg.mvStyleVar_GrabRounding, (6,)),
+    (dpg.mvStyleVar_TabRounding, (6,)),
+    (dpg.mvStyleVar_WindowPadding, (12, 12)),
+)
 
 class PCANExplorerGUI:
     """
@@ -57,6 +249,16 @@ class PCANExplorerGUI:
     
     # Configuration file path
     CONFIG_FILE = Path.home() / ".pythoncan_gui_config.json"
+
+    # BMS thermistor frames are 0x08F0X0ZZ (X = module ID, ZZ = message
+    # index); one masked compare against these gates the thermistor
+    # decode path for every received frame. The mask clears the module
+    # nibble and the message index so all six modules match.
+    BMS_THERM_ID_MASK = 0xFFFF0F00
+    BMS_THERM_ID_BASE = 0x08F00000
+
+    # Built theme object, shared across instances within one DPG context
+    _cached_theme = None
     
     def __init__(self, device_type: str = None, channel: Union[str, 'PCANChannel'] = None):
         """Initialize the GUI application.
@@ -96,9 +298,28 @@ class PCANExplorerGUI:
         else:
             raise ValueError(f"Unknown device type: {device_type}")
         
+        # Which driver attribute holds the active channel, resolved once
+        # per device type instead of hasattr-probing the driver per save
+        self._driver_channel_attr = '_channel' if self.device_type == 'pcan' else '_device_index'
+
         self.is_connected = False
+
+        # Single-producer/single-consumer handoff between the driver RX
+        # thread and the render loop: the RX callback only appends raw
+        # frames here (deque.append is atomic under the GIL, so no mutex
+        # per frame), and the render loop drains them. The bound drops the
+        # oldest frames instead of stalling the bus reader if the GUI
+        # falls behind.
+        self._rx_queue: deque = deque(maxlen=4096)
+
+        # Everything below is touched only on the GUI thread
         self.message_data: Dict[int, dict] = {}
-        self.message_lock = threading.Lock()
+
+        # CAN IDs touched since the last table repaint; the repaint swaps
+        # the sets out and only rebuilds those rows. _new_ids is the
+        # subset that still needs a table row created.
+        self._dirty_ids: set = set()
+        self._new_ids: set = set()
         
         # Track expanded rows for signal display
         self.expanded_rows: set = set()
@@ -107,13 +328,67 @@ class PCANExplorerGUI:
         self.send_messages: list = []  # List of messages to send
         self.send_messages_lock = threading.Lock()
         self.selected_send_row = None
+        # Listbox labels as last pushed to DPG plus label -> index map, so
+        # the listbox is only reconfigured when the labels actually change
+        # and selection resolves in O(1)
+        self._send_items: list = []
+        self._send_items_index: Dict[str, int] = {}
+        # Details-panel children are created once and reused; see
+        # _build_detail_items
+        self._detail_items_built = False
+        # Combo label -> value maps for the signal editor, rebuilt each
+        # time the dialog opens
+        self._signal_choice_maps: Dict[str, dict] = {}
+        # Set instead of rebuilding the listbox directly; the render loop
+        # drains it once per frame so bursts of edits/sends coalesce into
+        # a single rebuild
+        self._send_table_dirty = False
+
+        # Outgoing frames go through a rate-limited queue so rapid sends
+        # cannot overrun the driver's TX buffer: a background thread
+        # dispatches at most tx_batch frames per tx_interval window.
+        # Both knobs are persisted in the config for tuning.
+        self._tx_queue: deque = deque()
+        self._tx_event = threading.Event()
+        self._tx_stop = threading.Event()
+        self._tx_thread = None
+        self._tx_batch = int(config.get('tx_batch', 4))
+        self._tx_interval = float(config.get('tx_interval', 0.01))
         
         # GUI initialization state
         self.gui_initializing = True  # Flag to prevent saving during initialization
+
+        # Config writes are coalesced: callbacks mark the config dirty and
+        # the render loop flushes at most one JSON write per 500 ms
+        self._config_dirty = False
+        self._config_dirty_t = 0.0
+
+        # Short-TTL cache for CANable USB enumeration (time bucket, items)
+        self._canable_items_cache = None
+        # Device index (as string) -> combo label, rebuilt with the cache
+        self._canable_index_to_label: Dict[str, str] = {}
         
         # DBC database support
         self.dbc_database: Optional[cantools.database.Database] = None if DBC_SUPPORT else None
         self.dbc_file_path: Optional[str] = None
+
+        # Per-frame decode helpers: frame ID -> Message / bound decode method.
+        # Built once per DBC load so the RX path does a dict lookup instead of
+        # asking cantools to search the database for every frame.
+        self._dbc_msg_by_id: Dict[int, object] = {}
+        self._dbc_decode_by_id: Dict[int, Callable] = {}
+        self._dbc_fmt_by_id: Dict[int, dict] = {}
+        self._dbc_message_names: list = []
+        self._dbc_msg_by_name: Dict[str, object] = {}
+        # name -> (all-zero signal values, encoded payload), for adding
+        # messages to the send table without re-encoding defaults
+        self._dbc_defaults_by_name: Dict[str, tuple] = {}
+
+        # Hot-path BMS frame maps: frame ID -> [(signal_name, module, index)].
+        # Built once per DBC load so thermistor/cell updates avoid per-frame
+        # signal-name formatting and fallback scans.
+        self._therm_signal_maps: Dict[int, list] = {}
+        self._cell_signal_maps: Dict[int, list] = {}
         
         # GUI element tags
         self.channel_combo = None
@@ -124,19 +399,49 @@ class PCANExplorerGUI:
         self.stats_text = None
         self.dbc_status_text = None
         
-        # Thermistor monitoring - 6 modules × 56 thermistors = 336 total
-        self.thermistor_temps = [[None] * 56 for _ in range(6)]  # [module][channel]
-        self.thermistor_text_tags = [[None] * 56 for _ in range(6)]  # GUI text element tags per module
+        # Thermistor monitoring - 6 modules × 56 thermistors = 336 total.
+        # Values live in one flat module-major list (index = module * 56 +
+        # channel) so stats and refresh passes walk a single contiguous
+        # list; the DPG tag for each grid cell is precomputed in matching
+        # order. RX handlers store values and mark indices dirty, and the
+        # render loop repaints only the dirty cells.
+        self.thermistor_temps = [None] * (6 * 56)
+        self._therm_tags = tuple(sys.intern(f"therm_m{m}_temp_{c}") for m in range(6) for c in range(56))
+        self._therm_dirty: set = set()
+        # Last (string, color) pushed to DPG per cell, so repeat repaints
+        # with identical display output skip the DPG calls
+        self._therm_last: list = [None] * (6 * 56)
+        # Stats lines recompute only after a reading actually changed,
+        # and are only pushed to DPG when the text differs
+        self._therm_stats_dirty = False
+        self._last_therm_stats = ""
         self.current_thermistor_module = 0  # Currently displayed module (0-5)
-        
-        # Cell voltage monitoring - 6 modules × 18 cells = 108 total
-        self.cell_voltages = [[None] * 18 for _ in range(6)]  # [module][cell] - Store latest voltages (in mV)
+
+        # Cell voltage monitoring - 6 modules × 18 cells = 108 total,
+        # same flat layout (index = module * 18 + cell), voltages in mV
+        self.cell_voltages = [None] * (6 * 18)
+        self._cell_tags = tuple(sys.intern(f"cell_m{m}_v_{c}") for m in range(6) for c in range(18))
+        self._cell_dirty: set = set()
+        self._cell_last: list = [None] * (6 * 18)
+        self._cell_stats_dirty = False
+        self._last_cell_stats = ""
         self.stack_voltage = None  # Total stack voltage (in mV)
-        self.cell_voltage_text_tags = [[None] * 18 for _ in range(6)]  # GUI text element tags per module
+
+        # The monitor grids create hundreds of widgets - build each exactly
+        # once and never destroy/recreate them on tab or theme changes
+        self._therm_grid_built = False
+        self._cells_grid_built = False
+
+        # Pre-formatted display strings covering the realistic sensor
+        # ranges at display resolution (-40.0..125.0 °C, 0..5000 mV), so
+        # the refresh tick indexes a tuple instead of formatting floats
+        self._temp_strs = tuple(f"{i / 10:.1f}°C" for i in range(-400, 1251))
+        self._volt_strs = tuple(f"{v / 1000:.4f} V" for v in range(0, 5001))
         
-        # Statistics
+        # Statistics (start_time is a time.monotonic() baseline)
         self.total_messages = 0
         self.start_time = None
+        self._last_msg_stats = ""
     
     @staticmethod
     def _load_config_static() -> dict:
@@ -144,8 +449,8 @@ class PCANExplorerGUI:
         try:
             config_file = Path.home() / ".pythoncan_gui_config.json"
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+                with open(config_file, 'rb') as f:
+                    return _json_loads(f.read())
         except Exception as e:
             print(f"Warning: Could not load config: {e}")
         return {}
@@ -159,101 +464,75 @@ class PCANExplorerGUI:
         try:
             # Get current channel value from combo box
             channel_value = dpg.get_value(self.channel_combo) if self.channel_combo else None
-            
+
             config = {
                 'device_type': self.device_type,
                 'channel': channel_value,
                 'baudrate': dpg.get_value(self.baudrate_combo) if self.baudrate_combo else 'BAUD_500K',
-                'dbc_file': self.dbc_file_path
+                'dbc_file': self.dbc_file_path,
+                'tx_batch': self._tx_batch,
+                'tx_interval': self._tx_interval
             }
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file and replace atomically so the config is
+            # never seen half-written
+            tmp_file = self.CONFIG_FILE.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(config))
+            os.replace(tmp_file, self.CONFIG_FILE)
             print(f"Config saved: {config}")
         except Exception as e:
             print(f"Warning: Could not save config: {e}")
+
+    def _schedule_config_save(self):
+        """Mark the config dirty; the render loop writes it out debounced.
+
+        Rapid settings changes (toggling device/channel/baud dropdowns)
+        then cost one file write instead of one per callback, and no disk
+        I/O happens on the callback itself.
+        """
+        if self.gui_initializing:
+            return
+        self._config_dirty = True
+        self._config_dirty_t = time.monotonic()
+
+    def _flush_config_save(self, now: float = None):
+        """Write the config if it is dirty and the debounce window passed."""
+        if not self._config_dirty:
+            return
+        if now is not None and now - self._config_dirty_t < 0.5:
+            return
+        self._config_dirty = False
+        self._save_config()
     
     def _get_channel_string(self) -> Optional[str]:
         """Get the current channel as a string for saving."""
-        if self.device_type == 'pcan':
-            if hasattr(self.driver, '_channel') and self.driver._channel:
-                return self.driver._channel.name
-        else:  # canable
-            if hasattr(self.driver, '_device_index'):
-                return str(self.driver._device_index)
-        return None
-    
+        value = getattr(self.driver, self._driver_channel_attr, None)
+        if value is None:
+            return None
+        # PCAN channels are enum members; CANable uses an integer index
+        return value.name if self.device_type == 'pcan' else str(value)
+    
+    @classmethod
+    def _build_global_theme(cls):
+        """Build the shared DPG theme once and cache it on the class."""
+        if cls._cached_theme is not None:
+            return cls._cached_theme
+
+        with dpg.theme() as global_theme:
+            with dpg.theme_component(dpg.mvAll):
+                for enum, rgba in _THEME_COLORS:
+                    dpg.add_theme_color(enum, rgba)
+                for enum, values in _THEME_STYLES:
+                    dpg.add_theme_style(enum, *values)
+
+        cls._cached_theme = global_theme
+        return global_theme
+
     def setup_gui(self):
         """Set up the DearPyGUI interface with tabs."""
         dpg.create_context()
         
-        # Set up modern color theme with vibrant gradients
-        with dpg.theme() as global_theme:
-            with dpg.theme_component(dpg.mvAll):
-                # Modern dark theme with cyan/purple gradient accents
-                dpg.add_theme_color(dpg.mvThemeCol_WindowBg, (18, 18, 24, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ChildBg, (24, 24, 32, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_Border, (80, 70, 120, 180))
-                dpg.add_theme_color(dpg.mvThemeCol_FrameBg, (35, 35, 48, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_FrameBgHovered, (50, 50, 68, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_FrameBgActive, (65, 60, 85, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TitleBg, (25, 25, 40, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TitleBgActive, (40, 35, 60, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TitleBgCollapsed, (20, 20, 35, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_MenuBarBg, (25, 25, 40, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ScrollbarBg, (24, 24, 32, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ScrollbarGrab, (100, 80, 140, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ScrollbarGrabHovered, (120, 100, 160, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ScrollbarGrabActive, (140, 120, 180, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_CheckMark, (100, 200, 255, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_SliderGrab, (100, 180, 255, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_SliderGrabActive, (120, 200, 255, 255))
-                # Vibrant gradient buttons (cyan to purple)
-                dpg.add_theme_color(dpg.mvThemeCol_Button, (70, 100, 180, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonHovered, (90, 130, 220, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ButtonActive, (110, 150, 240, 255))
-                # Headers with purple tint
-                dpg.add_theme_color(dpg.mvThemeCol_Header, (80, 60, 140, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_HeaderHovered, (100, 80, 170, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_HeaderActive, (120, 100, 190, 255))
-                # Separators with gradient feel
-                dpg.add_theme_color(dpg.mvThemeCol_Separator, (90, 80, 130, 200))
-                dpg.add_theme_color(dpg.mvThemeCol_SeparatorHovered, (120, 100, 160, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_SeparatorActive, (140, 120, 180, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ResizeGrip, (80, 100, 180, 200))
-                dpg.add_theme_color(dpg.mvThemeCol_ResizeGripHovered, (100, 130, 220, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_ResizeGripActive, (120, 150, 240, 255))
-                # Tabs with gradient colors
-                dpg.add_theme_color(dpg.mvThemeCol_Tab, (50, 50, 85, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TabHovered, (90, 120, 200, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TabActive, (70, 100, 180, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TabUnfocused, (35, 35, 60, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TabUnfocusedActive, (50, 50, 85, 255))
-                # Table colors with better contrast
-                dpg.add_theme_color(dpg.mvThemeCol_TableHeaderBg, (45, 45, 75, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TableBorderStrong, (90, 80, 130, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TableBorderLight, (60, 55, 85, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TableRowBg, (0, 0, 0, 0))
-                dpg.add_theme_color(dpg.mvThemeCol_TableRowBgAlt, (100, 90, 140, 15))
-                # Text colors with better readability
-                dpg.add_theme_color(dpg.mvThemeCol_Text, (240, 240, 250, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_TextDisabled, (140, 140, 160, 255))
-                dpg.add_theme_color(dpg.mvThemeCol_PopupBg, (30, 30, 48, 245))
-                
-                # Enhanced style adjustments for modern look
-                dpg.add_theme_style(dpg.mvStyleVar_FrameRounding, 8)
-                dpg.add_theme_style(dpg.mvStyleVar_WindowRounding, 10)
-                dpg.add_theme_style(dpg.mvStyleVar_ChildRounding, 8)
-                dpg.add_theme_style(dpg.mvStyleVar_FramePadding, 10, 8)
-                dpg.add_theme_style(dpg.mvStyleVar_ItemSpacing, 10, 8)
-                dpg.add_theme_style(dpg.mvStyleVar_IndentSpacing, 22)
-                dpg.add_theme_style(dpg.mvStyleVar_ScrollbarSize, 16)
-                dpg.add_theme_style(dpg.mvStyleVar_ScrollbarRounding, 8)
-                dpg.add_theme_style(dpg.mvStyleVar_GrabMinSize, 14)
-                dpg.add_theme_style(dpg.mvStyleVar_GrabRounding, 6)
-                dpg.add_theme_style(dpg.mvStyleVar_TabRounding, 6)
-                dpg.add_theme_style(dpg.mvStyleVar_WindowPadding, 12, 12)
-        
-        dpg.bind_theme(global_theme)
+        dpg.bind_theme(self._build_global_theme())
         
         # Set up fonts
         with dpg.font_registry():
@@ -286,7 +565,7 @@ class PCANExplorerGUI:
                 
                 # Populate channel combo based on device type
                 if self.device_type == 'pcan':
-                    channel_items = [channel.name for channel in PCANChannel]
+                    channel_items = PCAN_CHANNEL_ITEMS
                     # Use saved channel or command line arg or default
                     if self.default_channel and hasattr(self.default_channel, 'name'):
                         default_channel = self.default_channel.name
@@ -298,28 +577,11 @@ class PCANExplorerGUI:
                         default_channel = "USB1"
                 else:
                     # For CANable, get available devices and show indices
-                    try:
-                        canable_devices = self.driver.get_available_devices()
-                        if canable_devices:
-                            channel_items = [f"Device {dev['index']}: {dev['description']}" for dev in canable_devices]
-                            # Try to match saved channel
-                            saved_idx = self.config.get('channel', '0') if self.default_channel is None else str(self.default_channel)
-                            default_channel = None
-                            for item in channel_items:
-                                if item.startswith(f"Device {saved_idx}:"):
-                                    default_channel = item
-                                    break
-                            if not default_channel:
-                                default_channel = channel_items[0] if channel_items else "Device 0"
-                        else:
-                            channel_items = ["Device 0", "Device 1", "Device 2"]
-                            saved_idx = self.config.get('channel', '0') if self.default_channel is None else str(self.default_channel)
-                            default_channel = f"Device {saved_idx}"
-                    except:
-                        channel_items = ["Device 0", "Device 1", "Device 2"]
-                        saved_idx = self.config.get('channel', '0') if self.default_channel is None else str(self.default_channel)
-                        default_channel = f"Device {saved_idx}"
-                
+                    channel_items = self._canable_channel_items()
+                    saved_idx = self.config.get('channel', '0') if self.default_channel is None else str(self.default_channel)
+                    # O(1) lookup of the saved channel's combo label
+                    default_channel = self._canable_index_to_label.get(str(saved_idx), channel_items[0])
+
                 self.channel_combo = dpg.add_combo(
                     items=channel_items,
                     default_value=default_channel,
@@ -330,7 +592,7 @@ class PCANExplorerGUI:
                 dpg.add_text(" Baud:")
                 
                 # Baud rate combo (same for both)
-                baudrate_items = [br.name for br in (PCANBaudRate if self.device_type == 'pcan' else CANableBaudRate)]
+                baudrate_items = PCAN_BAUDRATE_ITEMS if self.device_type == 'pcan' else CANABLE_BAUDRATE_ITEMS
                 default_baudrate = self.config.get('baudrate', 'BAUD_500K')
                 self.baudrate_combo = dpg.add_combo(
                     items=baudrate_items,
@@ -497,8 +759,6 @@ class PCANExplorerGUI:
                 dpg.add_table_column(label="Count", width_fixed=True, init_width_or_weight=60)
                 dpg.add_table_column(label="Last RX", width_fixed=True, init_width_or_weight=110)
                 dpg.add_table_column(label="Period", width_fixed=True, init_width_or_weight=70)
-                dpg.add_table_column(label="Last RX", width_fixed=True, init_width_or_weight=110)
-                dpg.add_table_column(label="Period", width_fixed=True, init_width_or_weight=70)
     
     def _setup_thermistor_tab(self):
         """Setup the Thermistor Monitor tab content - 336 thermistors (6 modules × 56)."""
@@ -565,6 +825,12 @@ class PCANExplorerGUI:
         Layout: 6 columns (one per module) × 18 rows (one per cell)
         Similar to thermistor display
         """
+        # Widget creation is expensive - the grid is built exactly once
+        # and its cells updated in place afterwards
+        if self._cells_grid_built:
+            return
+        self._cells_grid_built = True
+
         # Create table with 6 columns (one per module)
         with dpg.table(header_row=True, borders_innerH=True, borders_innerV=True, 
                       borders_outerH=True, borders_outerV=True, scrollY=True, height=600):
@@ -580,18 +846,42 @@ class PCANExplorerGUI:
                         with dpg.table_cell():
                             with dpg.group(horizontal=True):
                                 dpg.add_text(f"C{cell_idx+1:02d}:", color=(160, 170, 200))
-                                voltage_tag = f"cell_m{module_id}_v_{cell_idx}"
+                                # Tag matches self._cell_tags[module_id * 18 + cell_idx]
+                                voltage_tag = self._cell_tags[module_id * 18 + cell_idx]
                                 dpg.add_text("-.---- V", tag=voltage_tag, color=(100, 255, 180))
-                                
-                                # Store tag reference
-                                if self.cell_voltage_text_tags[module_id][cell_idx] is None:
-                                    self.cell_voltage_text_tags[module_id][cell_idx] = voltage_tag
 
     
     # ============================================================================
     # Connection Methods
     # ============================================================================
     
+    def _canable_channel_items(self) -> list:
+        """Get CANable device combo labels, cached for 5 seconds.
+
+        CANable enumeration is a USB round-trip, so toggling the device
+        type back and forth should not hit the bus each time. The cache
+        expires on its own after 5 s, which also picks up hot-plugged
+        devices without a manual refresh.
+        """
+        t_bucket = int(time.monotonic() / 5)
+        if self._canable_items_cache and self._canable_items_cache[0] == t_bucket:
+            return self._canable_items_cache[1]
+
+        try:
+            canable_devices = self.driver.get_available_devices()
+            if canable_devices:
+                index_to_label = {str(dev['index']): f"Device {dev['index']}: {dev['description']}"
+                                  for dev in canable_devices}
+            else:
+                index_to_label = {str(i): f"Device {i}" for i in range(3)}
+        except:
+            index_to_label = {str(i): f"Device {i}" for i in range(3)}
+
+        channel_items = list(index_to_label.values())
+        self._canable_index_to_label = index_to_label
+        self._canable_items_cache = (t_bucket, channel_items)
+        return channel_items
+
     def _on_device_type_changed(self, sender, app_data):
         """Handle device type change."""
         if self.is_connected:
@@ -603,36 +893,26 @@ class PCANExplorerGUI:
         # Update driver
         if new_device == 'pcan':
             self.driver = PCANDriver()
-            channel_items = [channel.name for channel in PCANChannel]
+            channel_items = PCAN_CHANNEL_ITEMS
             default_channel = "USB1"
-            baudrate_items = [br.name for br in PCANBaudRate]
+            baudrate_items = PCAN_BAUDRATE_ITEMS
         else:
             self.driver = CANableDriver()
-            # Get available CANable devices
-            try:
-                canable_devices = self.driver.get_available_devices()
-                if canable_devices:
-                    channel_items = [f"Device {dev['index']}: {dev['description']}" for dev in canable_devices]
-                    default_channel = channel_items[0]
-                else:
-                    channel_items = ["Device 0", "Device 1", "Device 2"]
-                    default_channel = "Device 0"
-            except:
-                channel_items = ["Device 0", "Device 1", "Device 2"]
-                default_channel = "Device 0"
-            baudrate_items = [br.name for br in CANableBaudRate]
+            channel_items = self._canable_channel_items()
+            default_channel = channel_items[0]
+            baudrate_items = CANABLE_BAUDRATE_ITEMS
         
         self.device_type = new_device
-        
+        self._driver_channel_attr = '_channel' if new_device == 'pcan' else '_device_index'
+
         # Update channel combo
         dpg.configure_item("channel_combo", items=channel_items, default_value=default_channel)
         
         # Update baudrate combo
         dpg.configure_item(self.baudrate_combo, items=baudrate_items, default_value="BAUD_500K")
         
-        # Only save config if not initializing (user manually changed device type)
-        if not self.gui_initializing:
-            self._save_config()
+        # Only saves if not initializing (user manually changed device type)
+        self._schedule_config_save()
     
     def _toggle_connection(self):
         """Connect or disconnect from CAN device."""
@@ -646,30 +926,28 @@ class PCANExplorerGUI:
                 baudrate = PCANBaudRate[baudrate_name]
             else:  # canable
                 # Extract device index from "Device X: Description" format
-                try:
-                    if channel_name.startswith("Device "):
-                        channel_index = int(channel_name.split(":")[0].split()[1])
-                    else:
-                        channel_index = 0
-                except:
-                    channel_index = 0
-                
-                channel = channel_index
+                m = _DEVICE_RE.match(channel_name)
+                channel = int(m.group(1)) if m else 0
                 baudrate = CANableBaudRate[baudrate_name]
             
             # Connect to device
             if self.driver.connect(channel, baudrate):
                 self.is_connected = True
-                self.start_time = datetime.now()
+                self.start_time = time.monotonic()
                 dpg.set_item_label(self.connect_button, "Disconnect")
                 dpg.set_value(self.status_text, f"Connected: {self.device_type.upper()} {channel_name} @ {baudrate_name}")
                 dpg.configure_item(self.status_text, color=(120, 220, 150))  # Soft green for connected
                 
                 # Start receiving messages
                 self.driver.start_receive_thread(self._on_message_received)
-                
+
+                # Start the TX dispatcher
+                self._tx_stop.clear()
+                self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+                self._tx_thread.start()
+
                 # Save connection settings
-                self._save_config()
+                self._schedule_config_save()
                 
                 # Disable controls
                 dpg.configure_item(self.channel_combo, enabled=False)
@@ -679,7 +957,14 @@ class PCANExplorerGUI:
             else:
                 self._show_popup("Connection Failed", f"Failed to connect to {self.device_type.upper()} device.")
         else:
-            # Disconnect
+            # Disconnect - stop the TX dispatcher first
+            self._tx_stop.set()
+            self._tx_event.set()
+            if self._tx_thread is not None:
+                self._tx_thread.join(timeout=1.0)
+                self._tx_thread = None
+            self._tx_queue.clear()
+
             if self.driver.disconnect():
                 self.is_connected = False
                 dpg.set_item_label(self.connect_button, "Connect")
@@ -715,34 +1000,102 @@ class PCANExplorerGUI:
     def _load_dbc_file_path(self, file_path: str):
         """Load a DBC file from a specific path."""
         try:
-            # Load with strict=False to allow extended 29-bit CAN IDs without validation errors
-            self.dbc_database = cantools.database.load_file(file_path, strict=False)
+            self.dbc_database = _load_dbc_cached(file_path, os.path.getmtime(file_path))
             self.dbc_file_path = file_path
+
+            # Index messages by frame ID for O(1) per-frame lookups
+            self._dbc_msg_by_id = {m.frame_id: m for m in self.dbc_database.messages}
+            self._dbc_decode_by_id = {m.frame_id: m.decode for m in self.dbc_database.messages}
+            self._dbc_fmt_by_id = {m.frame_id: {s.name: _signal_formatter(s) for s in m.signals}
+                                   for m in self.dbc_database.messages}
+            self._dbc_msg_by_name = {m.name: m for m in self.dbc_database.messages}
+            self._dbc_message_names = sorted(self._dbc_msg_by_name)
+            # Warm each message's codecs now, at load time, instead of
+            # lazily on the first frame from the bus: a dummy decode
+            # builds the decode structures and the default-values encode
+            # builds the encode side while also caching the all-zero
+            # payload used when adding the message to the send table.
+            # The parsed database is memoized, so this cost is paid once
+            # per file.
+            self._dbc_defaults_by_name = {}
+            for m in self.dbc_database.messages:
+                try:
+                    m.decode(bytes(m.length))
+                except Exception:
+                    pass
+                try:
+                    sig_values = {s.name: 0 for s in m.signals}
+                    self._dbc_defaults_by_name[m.name] = (sig_values, m.encode(sig_values))
+                except Exception:
+                    pass
+            self._build_bms_signal_maps()
             filename = os.path.basename(file_path)
             dpg.set_value(self.dbc_status_text, f"Loaded: {filename}")
             dpg.configure_item(self.dbc_status_text, color=(120, 220, 150))  # Soft green for success
             
-            # Debug: Print first few messages in DBC
-            print(f"\n[DEBUG] DBC loaded successfully: {filename}")
-            print(f"[DEBUG] Total messages in DBC: {len(self.dbc_database.messages)}")
-            print(f"[DEBUG] First 5 messages:")
-            for i, msg in enumerate(self.dbc_database.messages[:5]):
-                print(f"  {msg.name}: ID=0x{msg.frame_id:X} ({msg.frame_id})")
-            
+            if log.isEnabledFor(logging.DEBUG):
+                self._log_dbc_summary(filename)
+
             # Save config with new DBC path (only if not initializing)
-            if not self.gui_initializing:
-                self._save_config()
+            self._schedule_config_save()
         except Exception as e:
             # Don't show popup during auto-load, just update status
             dpg.set_value(self.dbc_status_text, f"Load failed: {filename if 'filename' in locals() else 'file'}")
             dpg.configure_item(self.dbc_status_text, color=(255, 140, 100))  # Orange for error
             print(f"Warning: Could not load DBC file {file_path}: {e}")
-    
+
+    def _log_dbc_summary(self, filename: str):
+        """Log a short summary of the loaded DBC (DEBUG only)."""
+        log.debug("DBC loaded successfully: %s", filename)
+        log.debug("Total messages in DBC: %d", len(self.dbc_database.messages))
+        for msg in self.dbc_database.messages[:5]:
+            log.debug("  %s: ID=0x%X (%d)", msg.name, msg.frame_id, msg.frame_id)
+
+    def _build_bms_signal_maps(self):
+        """Pre-map BMS frame signals to their display slots.
+
+        Scans the loaded DBC once and records, per frame ID, which decoded
+        signal feeds which thermistor channel or cell index. The per-frame
+        RX handlers then iterate a small precomputed list instead of
+        formatting candidate signal names and probing the decoded dict.
+        """
+        self._therm_signal_maps = {}
+        self._cell_signal_maps = {}
+
+        for message in self.dbc_database.messages:
+            therm_entries = []
+            cell_entries = []
+            # Module ID lives in bits 15-12 of the thermistor CAN IDs
+            module_from_id = (message.frame_id >> 12) & 0x0F
+
+            for signal in message.signals:
+                parts = signal.name.split('_')
+                # Thermistors: Temp_XXX with absolute numbering (0-335)
+                if len(parts) == 2 and parts[0] == 'Temp' and parts[1].isdigit():
+                    absolute = int(parts[1])
+                    channel = absolute - module_from_id * 56
+                    if module_from_id <= 5 and 0 <= channel < 56:
+                        therm_entries.append((signal.name, module_from_id, channel))
+                # Cell voltages: Cell_N_Voltage with global numbering (1-108)
+                elif (len(parts) == 3 and parts[0] == 'Cell'
+                        and parts[2] == 'Voltage' and parts[1].isdigit()):
+                    cell_num_global = int(parts[1])
+                    module_id = (cell_num_global - 1) // 18
+                    cell_idx = (cell_num_global - 1) % 18
+                    if 0 <= module_id < 6:
+                        cell_entries.append((signal.name, module_id, cell_idx))
+
+            if therm_entries:
+                self._therm_signal_maps[message.frame_id] = therm_entries
+            if cell_entries:
+                self._cell_signal_maps[message.frame_id] = cell_entries
+
     def _decode_message(self, can_id: int, data: bytes, is_extended: bool = False) -> Optional[dict]:
         """Decode CAN message using DBC.
         
         Returns:
-            Dictionary with 'summary' (str) and 'signals' (list of tuples) or None
+            Dictionary with 'name' (str), 'summary' (str), 'full' (str,
+            one line per signal) and 'signals' (list of tuples) or None
         """
         if not self.dbc_database:
             return None
@@ -750,57 +1103,39 @@ class PCANExplorerGUI:
             # For extended IDs, add bit 31 to match DBC storage format
             # DBC files store extended IDs with 0x80000000 flag set
             lookup_id = can_id | 0x80000000 if is_extended else can_id
-            print(f"[DEBUG] Decoding: can_id=0x{can_id:X}, is_extended={is_extended}, lookup_id=0x{lookup_id:X}")
-            
-            message = self.dbc_database.get_message_by_frame_id(lookup_id)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Decoding: can_id=0x%X, is_extended=%s, lookup_id=0x%X",
+                          can_id, is_extended, lookup_id)
+
+            message = self._dbc_msg_by_id.get(lookup_id)
+            if message is None:
+                return None
             decoded = message.decode(data)
+            fmt_by_name = self._dbc_fmt_by_id[lookup_id]
             signals = []
-            
+
+            # Formatters (choices lookup, scale-based precision, unit) were
+            # prebuilt per signal at DBC load time
             for signal_name, value in decoded.items():
-                signal = message.get_signal_by_name(signal_name)
-                unit = signal.unit if signal.unit else ""
-                
-                # Check if this signal has value table (enum)
-                if signal.choices:
-                    # Try to map the value to a choice name
-                    try:
-                        choice_name = signal.choices.get(int(value))
-                        if choice_name:
-                            signals.append((signal_name, choice_name, ""))
-                            continue
-                    except:
-                        pass
-                
-                # Format numeric values
-                if isinstance(value, float):
-                    # Use appropriate precision based on scale
-                    if signal.scale >= 1.0:
-                        value_str = f"{value:.1f}"
-                    elif signal.scale >= 0.1:
-                        value_str = f"{value:.2f}"
-                    elif signal.scale >= 0.01:
-                        value_str = f"{value:.2f}"
-                    else:
-                        value_str = f"{value:.3f}"
-                elif isinstance(value, int):
-                    value_str = str(value)
-                else:
-                    value_str = str(value)
-                
-                # Store signal name, value, and unit
+                value_str, unit = fmt_by_name[signal_name](value)
                 signals.append((signal_name, value_str, unit))
             
-            # Create summary
+            # Build both display strings now so toggling row expansion
+            # just picks one instead of rewalking the signal list
             summary = f"{len(signals)} signal{'s' if len(signals) != 1 else ''}"
-            
+            full = "\n".join(f"{n}: {v} {u}" if u else f"{n}: {v}"
+                             for n, v, u in signals)
+
             return {
+                'name': message.name,
                 'summary': summary,
+                'full': full,
                 'signals': signals
             }
         except Exception as e:
-            # Debug: print exception (remove after testing)
-            if is_extended and can_id == 0x18FF0000:
-                print(f"DEBUG: Decode failed for 0x{can_id:08X}: {type(e).__name__}: {str(e)}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Decode failed for 0x%08X: %s: %s",
+                          can_id, type(e).__name__, e)
             # Return None if decode fails (message not in DBC or decode error)
             return None
     
@@ -808,161 +1143,231 @@ class PCANExplorerGUI:
         """Get message name from DBC."""
         if not self.dbc_database:
             return None
-        try:
-            # For extended IDs, add bit 31 to match DBC storage format
-            lookup_id = can_id | 0x80000000 if is_extended else can_id
-            return self.dbc_database.get_message_by_frame_id(lookup_id).name
-        except:
-            return None
+        # For extended IDs, add bit 31 to match DBC storage format
+        lookup_id = can_id | 0x80000000 if is_extended else can_id
+        message = self._dbc_msg_by_id.get(lookup_id)
+        return message.name if message is not None else None
     
     def _on_message_received(self, msg):
-        """Callback for received CAN messages."""
-        # Check if this is thermistor data and update display
-        self._update_thermistor_data(msg.id, msg.data)
-        
-        # Check if this is cell voltage data and update display
-        self._update_cell_voltage_data(msg.id, msg.data)
-        
-        # Update message table
-        with self.message_lock:
+        """Callback for received CAN messages.
+
+        Runs on the driver's receive thread. The hot path is a single
+        deque append; all decoding, bookkeeping, and GUI work happens when
+        the render loop drains the queue on the GUI thread.
+        """
+        self._rx_queue.append((msg, time.time()))
+
+    def _drain_rx_queue(self):
+        """Process frames queued by the RX callback.
+
+        Called from the render loop only, so message_data and the dirty
+        sets need no locking.
+        """
+        # Bind hot attributes to locals once per drain; the loop body then
+        # runs on fast local loads instead of repeated self lookups
+        pop = self._rx_queue.popleft
+        message_data = self.message_data
+        dirty_ids = self._dirty_ids
+        therm_mask = self.BMS_THERM_ID_MASK
+        therm_base = self.BMS_THERM_ID_BASE
+        while True:
+            try:
+                msg, current_time = pop()
+            except IndexError:
+                break
+
+            # Thermistor frames gate on a single masked ID compare before
+            # any decode work happens
+            if (msg.id & therm_mask) == therm_base:
+                self._update_thermistor_data(msg.id, msg.data)
+
+            # Check if this is cell voltage data and update display
+            self._update_cell_voltage_data(msg.id, msg.data)
+
+            # Record latest data - decoding for display happens in the
+            # table repaint for the IDs marked dirty here
             self.total_messages += 1
-            current_time = datetime.now()
 
-            decoded_info = self._decode_message(msg.id, msg.data, msg.is_extended)
-            message_name = self._get_message_name(msg.id, msg.is_extended)
-            
-            if msg.id in self.message_data:
-                data = self.message_data[msg.id]
+            data = message_data.get(msg.id)
+            if data is not None:
                 data['count'] += 1
                 if data['last_time']:
-                    period_ms = (current_time - data['last_time']).total_seconds() * 1000
-                    data['period_ms'] = round(period_ms, 1)
+                    data['period_ms'] = round((current_time - data['last_time']) * 1000, 1)
                 data['last_time'] = current_time
-                data['last_timestamp'] = current_time.strftime("%H:%M:%S.%f")[:-3]
-                data['data'] = msg.data
+                if data['data'] != msg.data:
+                    data['data'] = msg.data
+                    data['data_hex'] = None  # Reformatted lazily at repaint
                 data['dlc'] = msg.dlc
-                data['decoded_info'] = decoded_info
-                data['name'] = message_name if message_name else ""
             else:
                 msg_type = "EXT" if msg.is_extended else "STD"
                 if msg.is_remote:
                     msg_type += "-R"
-                
-                self.message_data[msg.id] = {
+
+                message_data[msg.id] = {
                     'id': msg.id,
-                    'name': message_name if message_name else "",
+                    'name': "",
                     'type': msg_type,
+                    'is_extended': msg.is_extended,
                     'dlc': msg.dlc,
                     'data': msg.data,
-                    'decoded_info': decoded_info,
+                    'data_hex': None,
+                    'decoded_info': None,
                     'count': 1,
-                    'last_timestamp': current_time.strftime("%H:%M:%S.%f")[:-3],
                     'last_time': current_time,
                     'period_ms': 0.0,
                     'row_tag': None
                 }
+                self._new_ids.add(msg.id)
+            dirty_ids.add(msg.id)
     
     def _toggle_row_expansion(self, sender, app_data, user_data):
-        """Toggle signal expansion for a row."""
+        """Toggle signal expansion for a row.
+
+        Mutates just the toggled row's decoded cell and button; both
+        display strings were cached at decode time, so no table repaint
+        is needed.
+        """
         can_id = user_data
         if can_id in self.expanded_rows:
             self.expanded_rows.remove(can_id)
+            expanded = False
         else:
             self.expanded_rows.add(can_id)
-        self._update_message_table()
+            expanded = True
+
+        data = self.message_data.get(can_id)
+        if data is None:
+            return
+        decoded_info = data['decoded_info']
+        if decoded_info is None:
+            return
+        decoded_str = decoded_info['full'] if expanded else decoded_info['summary']
+        dpg.set_value(f"decoded_{can_id}", decoded_str)
+        if dpg.does_item_exist(f"expand_btn_{can_id}"):
+            dpg.configure_item(f"expand_btn_{can_id}", label="-" if expanded else "+")
     
     def _update_message_table(self):
-        """Update the message table display."""
-        with self.message_lock:
-            existing_rows = dpg.get_item_children("message_table", slot=1)
-            
-            for can_id, data in sorted(self.message_data.items()):
-                data_hex = ' '.join([f'{b:02X}' for b in data['data']])
-                
-                # Handle decoded signals display
-                decoded_info = data.get('decoded_info')
-                message_name = data.get('name', '') or ''
-                
-                if decoded_info:
-                    # Check if this row is expanded
-                    if can_id in self.expanded_rows:
-                        # Show full signal list
-                        decoded_lines = []
-                        for sig_name, sig_value, sig_unit in decoded_info['signals']:
-                            if sig_unit:
-                                decoded_lines.append(f"{sig_name}: {sig_value} {sig_unit}")
-                            else:
-                                decoded_lines.append(f"{sig_name}: {sig_value}")
-                        decoded_str = "\n".join(decoded_lines)
-                        button_label = "-"  # Minus when expanded (collapse)
-                    else:
-                        # Show summary only
-                        decoded_str = decoded_info['summary']
-                        button_label = "+"  # Plus when collapsed (expand)
-                else:
-                    decoded_str = ""
-                    button_label = ""
-                
-                if data['row_tag'] is None or data['row_tag'] not in existing_rows:
-                    with dpg.table_row(parent="message_table") as row_tag:
-                        # Format CAN ID with 8 digits for extended IDs, variable for standard
-                        can_id_str = f"0x{data['id']:08X}" if data['type'].startswith('EXT') else f"0x{data['id']:X}"
-                        dpg.add_text(can_id_str, tag=f"id_{can_id}")
-                        dpg.add_text(message_name, tag=f"name_{can_id}")
-                        dpg.add_text(data['type'], tag=f"type_{can_id}")
-                        dpg.add_text(str(data['dlc']), tag=f"dlc_{can_id}")
-                        dpg.add_text(data_hex, tag=f"data_{can_id}")
-                        
-                        # Decoded signals cell with expand/collapse button
-                        with dpg.group(horizontal=True, tag=f"decoded_group_{can_id}"):
-                            if decoded_info:
-                                dpg.add_button(
-                                    label=button_label,
-                                    callback=self._toggle_row_expansion,
-                                    user_data=can_id,
-                                    width=25,
-                                    height=20,
-                                    tag=f"expand_btn_{can_id}"
-                                )
-                            dpg.add_text(decoded_str, tag=f"decoded_{can_id}", wrap=220)
-                        
-                        dpg.add_text(str(data['count']), tag=f"count_{can_id}")
-                        dpg.add_text(data['last_timestamp'], tag=f"time_{can_id}")
-                        dpg.add_text(f"{data['period_ms']:.1f}", tag=f"period_{can_id}")
-                        data['row_tag'] = row_tag
+        """Repaint table rows for messages received since the last call."""
+        if not self._dirty_ids:
+            self._update_message_stats()
+            return
+
+        # Swap the dirty sets out and repaint just this batch. Only new
+        # rows need sorting (for a deterministic insertion order);
+        # set_value updates on existing rows are order-independent.
+        dirty_ids = self._dirty_ids
+        self._dirty_ids = set()
+        new_ids = self._new_ids
+        self._new_ids = set()
+
+        for can_id in sorted(new_ids) + list(dirty_ids - new_ids):
+            data = self.message_data.get(can_id)
+            if data is None:
+                continue  # Cleared between RX and repaint
+            # Cached per payload; rows dirty only from count/period updates
+            # reuse the previous string
+            data_hex = data['data_hex']
+            if data_hex is None:
+                data_hex = data['data_hex'] = _hex_str(data['data'])
+
+            # Timestamps stay numeric on the hot path; only dirty rows
+            # pay for strftime, here at repaint time
+            ts = data['last_time']
+            last_rx = time.strftime("%H:%M:%S", time.localtime(ts)) + f".{int(ts % 1 * 1000):03d}"
+
+            # Decode once per repaint rather than once per frame; the
+            # decode result carries the message name, so the separate
+            # name lookup only runs for frames that failed to decode
+            decoded_info = self._decode_message(can_id, data['data'], data['is_extended'])
+            data['decoded_info'] = decoded_info
+            if decoded_info is not None:
+                message_name = decoded_info['name']
+            else:
+                message_name = self._get_message_name(can_id, data['is_extended'])
+            message_name = message_name or ""
+            data['name'] = message_name
+
+            if decoded_info:
+                # Both strings were built at decode time; expansion state
+                # just selects one
+                if can_id in self.expanded_rows:
+                    decoded_str = decoded_info['full']
+                    button_label = "-"  # Minus when expanded (collapse)
                 else:
-                    dpg.set_value(f"name_{can_id}", message_name)
-                    dpg.set_value(f"type_{can_id}", data['type'])
-                    dpg.set_value(f"dlc_{can_id}", str(data['dlc']))
-                    dpg.set_value(f"data_{can_id}", data_hex)
-                    dpg.set_value(f"decoded_{can_id}", decoded_str)
-                    dpg.set_value(f"count_{can_id}", str(data['count']))
-                    dpg.set_value(f"time_{can_id}", data['last_timestamp'])
-                    dpg.set_value(f"period_{can_id}", f"{data['period_ms']:.1f}")
+                    decoded_str = decoded_info['summary']
+                    button_label = "+"  # Plus when collapsed (expand)
+            else:
+                decoded_str = ""
+                button_label = ""
+            
+            if data['row_tag'] is None:
+                with dpg.table_row(parent="message_table") as row_tag:
+                    # Format CAN ID with 8 digits for extended IDs, variable for standard
+                    can_id_str = f"0x{data['id']:08X}" if data['is_extended'] else f"0x{data['id']:X}"
+                    dpg.add_text(can_id_str, tag=f"id_{can_id}")
+                    dpg.add_text(message_name, tag=f"name_{can_id}")
+                    dpg.add_text(data['type'], tag=f"type_{can_id}")
+                    dpg.add_text(str(data['dlc']), tag=f"dlc_{can_id}")
+                    dpg.add_text(data_hex, tag=f"data_{can_id}")
                     
-                    # Update expand button if it exists
-                    if decoded_info and dpg.does_item_exist(f"expand_btn_{can_id}"):
-                        dpg.configure_item(f"expand_btn_{can_id}", label=button_label)
-            
-            # Update statistics
-            unique_ids = len(self.message_data)
-            if self.start_time:
-                elapsed = (datetime.now() - self.start_time).total_seconds()
-                rate = self.total_messages / elapsed if elapsed > 0 else 0
-                dpg.set_value(self.stats_text, 
-                            f"Total: {self.total_messages} | Unique IDs: {unique_ids} | Rate: {rate:.1f} msg/s")
-    
+                    # Decoded signals cell with expand/collapse button
+                    with dpg.group(horizontal=True, tag=f"decoded_group_{can_id}"):
+                        if decoded_info:
+                            dpg.add_button(
+                                label=button_label,
+                                callback=self._toggle_row_expansion,
+                                user_data=can_id,
+                                width=25,
+                                height=20,
+                                tag=f"expand_btn_{can_id}"
+                            )
+                        dpg.add_text(decoded_str, tag=f"decoded_{can_id}", wrap=220)
+                    
+                    dpg.add_text(str(data['count']), tag=f"count_{can_id}")
+                    dpg.add_text(last_rx, tag=f"time_{can_id}")
+                    dpg.add_text(f"{data['period_ms']:.1f}", tag=f"period_{can_id}")
+                    data['row_tag'] = row_tag
+            else:
+                dpg.set_value(f"name_{can_id}", message_name)
+                dpg.set_value(f"type_{can_id}", data['type'])
+                dpg.set_value(f"dlc_{can_id}", str(data['dlc']))
+                dpg.set_value(f"data_{can_id}", data_hex)
+                dpg.set_value(f"decoded_{can_id}", decoded_str)
+                dpg.set_value(f"count_{can_id}", str(data['count']))
+                dpg.set_value(f"time_{can_id}", last_rx)
+                dpg.set_value(f"period_{can_id}", f"{data['period_ms']:.1f}")
+                
+                # Update expand button if it exists
+                if decoded_info and dpg.does_item_exist(f"expand_btn_{can_id}"):
+                    dpg.configure_item(f"expand_btn_{can_id}", label=button_label)
+
+        self._update_message_stats()
+
+    def _update_message_stats(self):
+        """Update the statistics line below the message table."""
+        unique_ids = len(self.message_data)
+        if self.start_time:
+            elapsed = time.monotonic() - self.start_time
+            rate = self.total_messages / elapsed if elapsed > 0 else 0
+            stats = f"Total: {self.total_messages} | Unique IDs: {unique_ids} | Rate: {rate:.1f} msg/s"
+            # On an idle bus ticks produce the same line - skip the write
+            if stats != self._last_msg_stats:
+                self._last_msg_stats = stats
+                dpg.set_value(self.stats_text, stats)
+
     def _clear_messages(self):
         """Clear message table."""
-        with self.message_lock:
-            self.message_data.clear()
-            self.expanded_rows.clear()
-            self.total_messages = 0
-            self.start_time = datetime.now()
-            children = dpg.get_item_children("message_table", slot=1)
-            for child in children:
-                dpg.delete_item(child)
-            dpg.set_value(self.stats_text, "Total: 0 | Unique IDs: 0 | Rate: 0 msg/s")
+        self._rx_queue.clear()
+        self.message_data.clear()
+        self.expanded_rows.clear()
+        self._dirty_ids.clear()
+        self._new_ids.clear()
+        self.total_messages = 0
+        self.start_time = time.monotonic()
+        children = dpg.get_item_children("message_table", slot=1)
+        for child in children:
+            dpg.delete_item(child)
+        dpg.set_value(self.stats_text, "Total: 0 | Unique IDs: 0 | Rate: 0 msg/s")
     
     # ============================================================================
     # Send Message Methods
@@ -972,79 +1377,129 @@ class PCANExplorerGUI:
         """Handle selection in send messages listbox."""
         # Find the index of the selected message
         selected_label = app_data
-        print(f"[DEBUG] Listbox selection callback: '{selected_label}'")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Listbox selection callback: '%s'", selected_label)
         
         if not selected_label:
             self.selected_send_row = None
             self._update_send_message_details()
             return
-        
-        # Find which message was selected
-        with self.send_messages_lock:
-            for idx, msg in enumerate(self.send_messages):
-                msg_type = "EXT" if msg['is_extended'] else "STD"
-                label = f"{msg['name']} (0x{msg['can_id']:X} {msg_type}) - Sent: {msg['sent_count']}"
-                if label == selected_label:
-                    self.selected_send_row = idx
-                    print(f"[DEBUG] Selected message index: {idx}, name: {msg['name']}")
-                    self._update_send_message_details()
-                    
-                    # Check for double-click to send
-                    if dpg.is_mouse_button_double_clicked(dpg.mvMouseButton_Left):
-                        print(f"[DEBUG] Double-click detected, sending message")
-                        self._send_selected_message()
-                    break
+
+        # Resolve the selected label through the cached index map
+        idx = self._send_items_index.get(selected_label)
+        if idx is not None and idx < len(self.send_messages):
+            self.selected_send_row = idx
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Selected message index: %d, name: %s",
+                          idx, self.send_messages[idx]['name'])
+            self._update_send_message_details()
+
+            # Check for double-click to send
+            if dpg.is_mouse_button_double_clicked(dpg.mvMouseButton_Left):
+                log.debug("Double-click detected, sending message")
+                self._send_selected_message()
     
+    def _build_detail_items(self):
+        """Create the reusable children of the details panel once.
+
+        DPG item creation/destruction is comparatively expensive, so the
+        panel keeps a fixed skeleton plus a growable pool of text items
+        for signal lines; selection changes just set values and toggle
+        visibility.
+        """
+        parent = "send_message_details"
+        # Drop the placeholder text added at GUI construction
+        for child in dpg.get_item_children(parent, slot=1):
+            dpg.delete_item(child)
+        self._detail_no_sel = dpg.add_text("No message selected",
+                                           color=(180, 190, 220), parent=parent)
+        # Name, CAN ID, Type, DLC, Data, Sent Count
+        self._detail_fixed = [dpg.add_text("", parent=parent, show=False)
+                              for _ in range(6)]
+        self._detail_sep = dpg.add_separator(parent=parent, show=False)
+        self._detail_header = dpg.add_text("Signals:", color=(140, 200, 255),
+                                           parent=parent, show=False)
+        self._detail_pool: list = []
+        self._detail_items_built = True
+
     def _update_send_message_details(self):
-        """Update the message details panel."""
+        """Update the message details panel (reusing pooled items)."""
         try:
-            # Clear existing details
-            if dpg.does_item_exist("send_message_details"):
-                children = dpg.get_item_children("send_message_details", slot=1)
-                for child in children:
-                    dpg.delete_item(child)
-            
-            if self.selected_send_row is None or self.selected_send_row >= len(self.send_messages):
-                dpg.add_text("No message selected", color=(180, 190, 220), parent="send_message_details")
+            if not dpg.does_item_exist("send_message_details"):
+                return
+            if not self._detail_items_built:
+                self._build_detail_items()
+
+            no_selection = (self.selected_send_row is None
+                            or self.selected_send_row >= len(self.send_messages))
+            dpg.configure_item(self._detail_no_sel, show=no_selection)
+            if no_selection:
+                for item in self._detail_fixed:
+                    dpg.configure_item(item, show=False)
+                dpg.configure_item(self._detail_sep, show=False)
+                dpg.configure_item(self._detail_header, show=False)
+                for item in self._detail_pool:
+                    dpg.configure_item(item, show=False)
             else:
                 with self.send_messages_lock:
                     msg = self.send_messages[self.selected_send_row]
-                    
-                    msg_type = "EXT" if msg['is_extended'] else "STD"
-                    if msg['is_remote']:
-                        msg_type += "-R"
-                    
-                    data_hex = ' '.join([f'{b:02X}' for b in msg['data']])
-                    
-                    dpg.add_text(f"Name: {msg['name']}", color=(100, 255, 200), parent="send_message_details")
-                    dpg.add_text(f"CAN ID: 0x{msg['can_id']:X}", color=(220, 220, 255), parent="send_message_details")
-                    dpg.add_text(f"Type: {msg_type}", color=(220, 220, 255), parent="send_message_details")
-                    dpg.add_text(f"DLC: {msg['dlc']}", color=(220, 220, 255), parent="send_message_details")
-                    dpg.add_text(f"Data: {data_hex}", color=(220, 220, 255), parent="send_message_details")
-                    dpg.add_text(f"Sent Count: {msg['sent_count']}", color=(220, 220, 255), parent="send_message_details")
-                    dpg.add_separator(parent="send_message_details")
-                    dpg.add_text("Signals:", color=(140, 200, 255), parent="send_message_details")
-                    
-                    if msg['signal_values'] and msg['dbc_message']:
-                        try:
-                            for sig_name, sig_value in msg['signal_values'].items():
-                                signal = msg['dbc_message'].get_signal_by_name(sig_name)
-                                if signal.choices and int(sig_value) in signal.choices:
-                                    value_str = signal.choices[int(sig_value)]
-                                    dpg.add_text(f"  {sig_name} = {sig_value} ({value_str})", color=(220, 220, 255), parent="send_message_details")
-                                else:
-                                    dpg.add_text(f"  {sig_name} = {sig_value}", color=(220, 220, 255), parent="send_message_details")
-                        except Exception as e:
-                            dpg.add_text(f"  Error displaying signals: {e}", color=(255, 100, 120), parent="send_message_details")
-                    else:
-                        dpg.add_text("  No signals (custom message)", color=(180, 190, 220), parent="send_message_details")
+
+                    # Static lines are formatted once per message and
+                    # invalidated when the message is edited; only the
+                    # sent count changes between selections
+                    detail_lines = msg['detail_lines']
+                    if detail_lines is None:
+                        msg_type = "EXT" if msg['is_extended'] else "STD"
+                        if msg['is_remote']:
+                            msg_type += "-R"
+                        detail_lines = [
+                            (f"Name: {msg['name']}", (100, 255, 200)),
+                            (f"CAN ID: 0x{msg['can_id']:X}", (220, 220, 255)),
+                            (f"Type: {msg_type}", (220, 220, 255)),
+                            (f"DLC: {msg['dlc']}", (220, 220, 255)),
+                            (f"Data: {_hex_str(msg['data'])}", (220, 220, 255)),
+                        ]
+                        msg['detail_lines'] = detail_lines
+
+                    fixed_lines = detail_lines + [
+                        (f"Sent Count: {msg['sent_count']}", (220, 220, 255))
+                    ]
+                    for item, (text, color) in zip(self._detail_fixed, fixed_lines):
+                        dpg.set_value(item, text)
+                        dpg.configure_item(item, color=color, show=True)
+                    dpg.configure_item(self._detail_sep, show=True)
+                    dpg.configure_item(self._detail_header, show=True)
+
+                    signal_lines = msg['signal_lines']
+                    if signal_lines is None:
+                        signal_lines = []
+                        if msg['signal_values'] and msg['dbc_message']:
+                            try:
+                                for sig_name, sig_value in msg['signal_values'].items():
+                                    signal = msg['dbc_message'].get_signal_by_name(sig_name)
+                                    if signal.choices and int(sig_value) in signal.choices:
+                                        value_str = signal.choices[int(sig_value)]
+                                        signal_lines.append((f"  {sig_name} = {sig_value} ({value_str})", (220, 220, 255)))
+                                    else:
+                                        signal_lines.append((f"  {sig_name} = {sig_value}", (220, 220, 255)))
+                            except Exception as e:
+                                signal_lines.append((f"  Error displaying signals: {e}", (255, 100, 120)))
+                        else:
+                            signal_lines.append(("  No signals (custom message)", (180, 190, 220)))
+                        msg['signal_lines'] = signal_lines
+
+                    # Grow the pool as needed, then show exactly one item
+                    # per signal line and hide the leftovers
+                    while len(self._detail_pool) < len(signal_lines):
+                        self._detail_pool.append(
+                            dpg.add_text("", parent="send_message_details", show=False))
+                    for item, (text, color) in zip(self._detail_pool, signal_lines):
+                        dpg.set_value(item, text)
+                        dpg.configure_item(item, color=color, show=True)
+                    for item in self._detail_pool[len(signal_lines):]:
+                        dpg.configure_item(item, show=False)
         except Exception as e:
             print(f"[ERROR] Failed to update message details: {e}")
-            # Try to at least show an error message
-            try:
-                dpg.add_text(f"Error: {e}", color=(255, 100, 100), parent="send_message_details")
-            except:
-                pass
     
     def _show_add_dbc_message_dialog(self):
         """Show dialog to add a message from DBC file."""
@@ -1062,8 +1517,7 @@ class PCANExplorerGUI:
             dpg.add_separator()
             
             # List all messages
-            message_names = [msg.name for msg in self.dbc_database.messages]
-            dpg.add_listbox(items=message_names, tag="dbc_message_selector", 
+            dpg.add_listbox(items=self._dbc_message_names, tag="dbc_message_selector",
                            num_items=15, width=480)
             
             dpg.add_separator()
@@ -1080,19 +1534,16 @@ class PCANExplorerGUI:
             return
         
         try:
-            message = self.dbc_database.get_message_by_name(selected_name)
-            
-            # Create default signal values (all zeros)
-            signal_values = {}
-            for signal in message.signals:
-                # Use default value or 0
-                if signal.choices and 0 in signal.choices:
-                    signal_values[signal.name] = 0
-                else:
-                    signal_values[signal.name] = 0
-            
-            # Encode the message with default values
-            data = message.encode(signal_values)
+            message = self._dbc_msg_by_name[selected_name]
+
+            # Default (all-zero) signal values and their encoding were
+            # cached at DBC load; copy the dict since the user edits it
+            defaults = self._dbc_defaults_by_name.get(selected_name)
+            if defaults is not None:
+                signal_values, data = dict(defaults[0]), defaults[1]
+            else:
+                signal_values = {s.name: 0 for s in message.signals}
+                data = message.encode(signal_values)
             
             # Determine if extended ID
             is_extended = message.frame_id > 0x7FF
@@ -1108,7 +1559,11 @@ class PCANExplorerGUI:
                 'signal_values': signal_values,
                 'dbc_message': message,
                 'sent_count': 0,
-                'row_tag': None
+                'row_tag': None,
+                'label': None,
+                'label_sent': -1,
+                'detail_lines': None,
+                'signal_lines': None
             }
             
             with self.send_messages_lock:
@@ -1116,7 +1571,7 @@ class PCANExplorerGUI:
                 # Select the newly added message
                 self.selected_send_row = len(self.send_messages) - 1
             
-            self._update_send_messages_table()
+            self._send_table_dirty = True
             dpg.delete_item("add_dbc_msg_window")
             
         except Exception as e:
@@ -1172,7 +1627,11 @@ class PCANExplorerGUI:
                 'signal_values': None,
                 'dbc_message': None,
                 'sent_count': 0,
-                'row_tag': None
+                'row_tag': None,
+                'label': None,
+                'label_sent': -1,
+                'detail_lines': None,
+                'signal_lines': None
             }
             
             with self.send_messages_lock:
@@ -1180,7 +1639,7 @@ class PCANExplorerGUI:
                 # Select the newly added message
                 self.selected_send_row = len(self.send_messages) - 1
             
-            self._update_send_messages_table()
+            self._send_table_dirty = True
             dpg.delete_item("add_custom_msg_window")
             
         except Exception as e:
@@ -1208,7 +1667,12 @@ class PCANExplorerGUI:
         
         if dpg.does_item_exist("signal_editor_window"):
             dpg.delete_item("signal_editor_window")
-        
+
+        # Reverse combo-label -> value maps, filled while the combos are
+        # built so Apply resolves selections without re-parsing labels
+        self._signal_choice_maps = {}
+
+
         with dpg.window(label=f"Edit Signals - {msg['name']}", modal=True, 
                        tag="signal_editor_window", width=600, height=500, pos=(350, 150)):
             dpg.add_text(f"Message: {msg['name']} (0x{msg['can_id']:X})", color=(140, 200, 255))
@@ -1230,7 +1694,10 @@ class PCANExplorerGUI:
                         
                         # If signal has choices (value table), use combo box
                         if signal.choices:
-                            choices_list = [f"{v}: {name}" for v, name in signal.choices.items()]
+                            label_to_value = {f"{v}: {name}": int(v)
+                                              for v, name in signal.choices.items()}
+                            self._signal_choice_maps[signal.name] = label_to_value
+                            choices_list = list(label_to_value)
                             # Find current selection
                             default_choice = f"{int(current_value)}: {signal.choices.get(int(current_value), 'Unknown')}"
                             dpg.add_combo(items=choices_list, default_value=default_choice,
@@ -1266,9 +1733,13 @@ class PCANExplorerGUI:
             for signal in dbc_msg.signals:
                 tag = f"signal_input_{signal.name}"
                 if signal.choices:
-                    # Parse "value: name" format
                     combo_value = dpg.get_value(tag)
-                    value = int(combo_value.split(":")[0])
+                    # O(1) reverse lookup; fall back to parsing the
+                    # "value: name" format for labels outside the value
+                    # table (e.g. the 'Unknown' placeholder)
+                    value = self._signal_choice_maps.get(signal.name, {}).get(combo_value)
+                    if value is None:
+                        value = int(combo_value.split(":")[0])
                     new_signal_values[signal.name] = value
                 else:
                     new_signal_values[signal.name] = dpg.get_value(tag)
@@ -1280,8 +1751,14 @@ class PCANExplorerGUI:
             msg['signal_values'] = new_signal_values
             msg['data'] = new_data
             msg['dlc'] = len(new_data)
-            
-            self._update_send_messages_table()
+            msg['label'] = None
+            msg['detail_lines'] = None
+            msg['signal_lines'] = None
+
+            self._send_table_dirty = True
+            # Labels may be unchanged (data-only edit), so refresh the
+            # details panel explicitly
+            self._update_send_message_details()
             dpg.delete_item("signal_editor_window")
             
         except Exception as e:
@@ -1294,8 +1771,8 @@ class PCANExplorerGUI:
         if dpg.does_item_exist("edit_custom_msg_window"):
             dpg.delete_item("edit_custom_msg_window")
         
-        data_hex = ' '.join([f'{b:02X}' for b in msg['data']])
-        
+        data_hex = _hex_str(msg['data'])
+
         with dpg.window(label="Edit Custom Message", modal=True, tag="edit_custom_msg_window",
                        width=450, height=300, pos=(400, 250)):
             dpg.add_text("Edit custom CAN message:", color=(140, 200, 255))
@@ -1334,8 +1811,14 @@ class PCANExplorerGUI:
             msg['dlc'] = len(msg['data'])
             msg['is_extended'] = dpg.get_value("edit_msg_ext")
             msg['is_remote'] = dpg.get_value("edit_msg_rtr")
-            
-            self._update_send_messages_table()
+            msg['label'] = None
+            msg['detail_lines'] = None
+            msg['signal_lines'] = None
+
+            self._send_table_dirty = True
+            # Labels may be unchanged (data-only edit), so refresh the
+            # details panel explicitly
+            self._update_send_message_details()
             dpg.delete_item("edit_custom_msg_window")
             
         except Exception as e:
@@ -1351,7 +1834,7 @@ class PCANExplorerGUI:
             self.send_messages.pop(self.selected_send_row)
         
         self.selected_send_row = None
-        self._update_send_messages_table()
+        self._send_table_dirty = True
     
     def _clear_send_messages(self):
         """Clear all send messages."""
@@ -1359,61 +1842,93 @@ class PCANExplorerGUI:
             self.send_messages.clear()
         
         self.selected_send_row = None
-        self._update_send_messages_table()
+        self._send_table_dirty = True
     
+    def _tx_loop(self):
+        """Background TX dispatcher.
+
+        Sends at most _tx_batch queued frames, then sleeps _tx_interval,
+        so bursts of sends are paced to what the driver's TX buffer can
+        absorb instead of flooding it and dropping frames.
+        """
+        while not self._tx_stop.is_set():
+            if not self._tx_queue:
+                self._tx_event.wait(timeout=0.1)
+                self._tx_event.clear()
+                continue
+
+            for _ in range(self._tx_batch):
+                try:
+                    msg = self._tx_queue.popleft()
+                except IndexError:
+                    break
+                try:
+                    self.driver.send_message(msg['can_id'], msg['data'], msg['is_extended'], msg['is_remote'])
+                    msg['sent_count'] += 1
+                    # Bool store is atomic; the render loop picks it up
+                    self._send_table_dirty = True
+                except Exception as e:
+                    print(f"[ERROR] Send failed for 0x{msg['can_id']:X}: {e}")
+
+            time.sleep(self._tx_interval)
+
     def _send_selected_message(self):
-        """Send the currently selected message."""
-        print(f"[DEBUG] Send button clicked, selected_send_row: {self.selected_send_row}, total messages: {len(self.send_messages)}")
-        
+        """Queue the currently selected message for sending."""
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Send button clicked, selected_send_row: %s, total messages: %d",
+                      self.selected_send_row, len(self.send_messages))
+
         if self.selected_send_row is None or self.selected_send_row >= len(self.send_messages):
             self._show_popup("No Selection", "Please select a message to send.")
             return
-            
+
         if not self.is_connected:
             self._show_popup("Not Connected", "Please connect to CAN device first.")
             return
-        
-        try:
-            msg = self.send_messages[self.selected_send_row]
-            print(f"[DEBUG] Sending message: {msg['name']}, ID: 0x{msg['can_id']:X}")
-            self.driver.send_message(msg['can_id'], msg['data'], msg['is_extended'], msg['is_remote'])
-            
-            # Increment sent count
-            msg['sent_count'] += 1
-            print(f"[DEBUG] Message sent successfully, count: {msg['sent_count']}")
-            self._update_send_messages_table()
-            
-        except Exception as e:
-            print(f"[DEBUG] Send failed: {e}")
-            self._show_popup("Send Failed", f"Error: {str(e)}")
+
+        msg = self.send_messages[self.selected_send_row]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Queueing message: %s, ID: 0x%X", msg['name'], msg['can_id'])
+        self._tx_queue.append(msg)
+        self._tx_event.set()
     
     def _update_send_messages_table(self):
         """Update the send messages listbox display."""
         # Store the current selection index before updating
         current_selection_idx = self.selected_send_row
         
-        # Build list of message names with IDs
+        # Build list of message names with IDs; labels are cached per
+        # message and only reformatted when the sent count moved or the
+        # message was edited
         message_labels = []
         with self.send_messages_lock:
-            for idx, msg in enumerate(self.send_messages):
-                msg_type = "EXT" if msg['is_extended'] else "STD"
-                label = f"{msg['name']} (0x{msg['can_id']:X} {msg_type}) - Sent: {msg['sent_count']}"
+            for msg in self.send_messages:
+                label = msg['label']
+                if label is None or msg['label_sent'] != msg['sent_count']:
+                    msg_type = "EXT" if msg['is_extended'] else "STD"
+                    label = f"{msg['name']} (0x{msg['can_id']:X} {msg_type}) - Sent: {msg['sent_count']}"
+                    msg['label'] = label
+                    msg['label_sent'] = msg['sent_count']
                 message_labels.append(label)
-        
-        # Update listbox
+
+        # Update listbox - only push items to DPG when the labels changed
         if dpg.does_item_exist("send_messages_listbox"):
-            # Temporarily disable callback to prevent triggering during update
-            dpg.configure_item("send_messages_listbox", items=message_labels, callback=None)
-            
-            # Restore selection if valid
-            if current_selection_idx is not None and current_selection_idx < len(message_labels):
-                dpg.set_value("send_messages_listbox", message_labels[current_selection_idx])
-            
-            # Re-enable callback
-            dpg.configure_item("send_messages_listbox", callback=self._on_send_message_selected)
-            
-            # Update details panel
-            self._update_send_message_details()
+            if message_labels != self._send_items:
+                self._send_items = message_labels
+                self._send_items_index = {label: idx for idx, label in enumerate(message_labels)}
+
+                # Temporarily disable callback to prevent triggering during update
+                dpg.configure_item("send_messages_listbox", items=message_labels, callback=None)
+
+                # Restore selection if valid
+                if current_selection_idx is not None and current_selection_idx < len(message_labels):
+                    dpg.set_value("send_messages_listbox", message_labels[current_selection_idx])
+
+                # Re-enable callback
+                dpg.configure_item("send_messages_listbox", callback=self._on_send_message_selected)
+
+                # Update details panel
+                self._update_send_message_details()
     
     
     # ============================================================================
@@ -1426,6 +1941,12 @@ class PCANExplorerGUI:
         Layout: 6 modules horizontally, 56 channels vertically
         Creates a 56-row table with 6 columns (one per module)
         """
+        # Widget creation is expensive - the grid is built exactly once
+        # and its cells updated in place afterwards
+        if self._therm_grid_built:
+            return
+        self._therm_grid_built = True
+
         # Create table with headers for each module
         with dpg.table(header_row=True, borders_innerH=True, borders_innerV=True, 
                       borders_outerH=True, borders_outerV=True, scrollY=True):
@@ -1441,12 +1962,9 @@ class PCANExplorerGUI:
                         with dpg.table_cell():
                             with dpg.group(horizontal=True):
                                 dpg.add_text(f"Ch{channel:02d}:", color=(160, 170, 200))
-                                temp_tag = f"therm_m{module_id}_temp_{channel}"
+                                # Tag matches self._therm_tags[module_id * 56 + channel]
+                                temp_tag = self._therm_tags[module_id * 56 + channel]
                                 dpg.add_text("--.-°C", tag=temp_tag, color=(100, 255, 180))
-                                
-                                # Store tag reference
-                                if self.thermistor_text_tags[module_id][channel] is None:
-                                    self.thermistor_text_tags[module_id][channel] = temp_tag
     
     def _create_thermistor_grid(self, module_id: int):
         """Legacy method - now creates all thermistors grid."""
@@ -1479,80 +1997,45 @@ class PCANExplorerGUI:
         if not self.dbc_database:
             return
 
+        # For extended IDs, add bit 31 to match DBC storage format
+        lookup_id = can_id | 0x80000000  # Assume all thermistor messages are extended
+        sig_map = self._therm_signal_maps.get(lookup_id)
+        if sig_map is None:
+            return  # Not a thermistor message
+
         try:
-            # For extended IDs, add bit 31 to match DBC storage format
-            lookup_id = can_id | 0x80000000 if True else can_id  # Assume all thermistor messages are extended
-            message = self.dbc_database.get_message_by_frame_id(lookup_id)
-            decoded = message.decode(data)
-            
-            current_time = datetime.now().strftime("%H:%M:%S")
-            
-            # Extract module ID from CAN ID (bits 15-12)
-            # Example: 0x08F02005 -> bits 15-12 = 0x2 (module 2)
-            module_id = (can_id >> 12) & 0x0F
-            
-            if module_id > 5:
-                return  # Invalid module ID
-            
-            # Check if this is a temperature message (group 0x0, indices 0x00-0x0D)
-            msg_index = can_id & 0xFF
-            
-            if msg_index <= 0x0D:  # Temperature messages (14 messages, 0x00-0x0D)
-                # DBC uses ABSOLUTE thermistor numbering (0-335)
-                # Calculate the absolute base for this message
-                absolute_base = (module_id * 56) + (msg_index * 4)
-                
-                # Process each temperature signal in the message (4 per message)
-                for i in range(4):
-                    absolute_therm_num = absolute_base + i
-                    
-                    # Channel within this module (0-55)
-                    channel = (msg_index * 4) + i
-                    if channel >= 56:
-                        continue
-                    
-                    # Signal name in DBC is absolute: Temp_XXX (0-335)
-                    signal_name = f'Temp_{absolute_therm_num:03d}'
-                    
-                    if signal_name in decoded:
-                        temp_value = decoded[signal_name]
-                        self._update_single_thermistor(module_id, channel, temp_value, current_time)
-                    else:
-                        # Try alternate patterns if absolute naming doesn't work
-                        for pattern in [f'Temp_{channel:03d}', f'Temp_Therm_{channel}', f'Temp_{i}']:
-                            if pattern in decoded:
-                                temp_value = decoded[pattern]
-                                self._update_single_thermistor(module_id, channel, temp_value, current_time)
-                                break
-            
+            decoded = self._dbc_decode_by_id[lookup_id](data)
+
+            # Slot assignments were precomputed from the DBC at load time,
+            # so no signal-name formatting happens per frame
+            for signal_name, module_id, channel in sig_map:
+                value = decoded.get(signal_name)
+                if value is not None:
+                    self._update_single_thermistor(module_id, channel, value)
+
         except Exception as e:
-            # Message not in DBC or decode error - silently ignore
+            # Decode error - silently ignore
             pass
     
-    def _update_single_thermistor(self, module_id: int, channel: int, temp: float, time_str: str):
+    def _update_single_thermistor(self, module_id: int, channel: int, temp: float):
         """Update a single thermistor channel display.
-        
+
         Args:
             module_id: Module number (0-5)
             channel: Channel number within module (0-55)
             temp: Temperature value in degrees C
-            time_str: Timestamp string
         """
         if module_id >= 6 or channel >= 56:
             return
-        
-        # Update stored value
-        self.thermistor_temps[module_id][channel] = temp
-        
-        # Update GUI - only if this module is currently displayed
-        temp_tag = f"therm_m{module_id}_temp_{channel}"
-        if dpg.does_item_exist(temp_tag):
-            temp_color = self._get_temp_color(temp)
-            dpg.set_value(temp_tag, f"{temp:.1f}°C")
-            dpg.configure_item(temp_tag, color=temp_color)
-        
-        # Update statistics
-        self._update_thermistor_stats()
+
+        # Always store the reading so stats and CSV export see the latest
+        # value; the render loop compares the formatted text against what
+        # is already shown, so sub-resolution changes still cost nothing
+        # on the GUI side
+        idx = module_id * 56 + channel
+        self.thermistor_temps[idx] = temp
+        self._therm_dirty.add(idx)
+        self._therm_stats_dirty = True
     
     def _decode_thermistor_pair(self, data: bytes, base_channel: int):
         """Decode a thermistor pair message and update display."""
@@ -1564,60 +2047,114 @@ class PCANExplorerGUI:
         # REMOVED - now using DBC decoder directly
         pass
     
-    def _get_temp_color(self, temp: float):
+    @staticmethod
+    def _get_temp_color(temp: float):
         """Get color for temperature display based on value."""
-        if temp < -50:
-            return (120, 160, 255)  # Very cold - blue
-        elif temp < 0:
-            return (140, 200, 255)  # Cold - light blue
-        elif temp < 25:
-            return (120, 220, 150)  # Normal - soft green
-        elif temp < 50:
-            return (240, 220, 120)  # Warm - yellow
-        elif temp < 85:
-            return (255, 180, 100)  # Hot - orange
-        else:
-            return (255, 120, 120)  # Very hot - soft red
+        return _TEMP_COLORS[bisect.bisect_right(_TEMP_THRESHOLDS, temp)]
     
+    def _refresh_monitor_cells(self):
+        """Repaint thermistor and cell-voltage cells changed since last tick.
+
+        Called from the render loop; drains the dirty index sets filled by
+        the RX handlers so each changed cell is formatted and pushed to DPG
+        once per tick, no matter how many frames updated it in between.
+        """
+        if self._therm_dirty:
+            dirty = self._therm_dirty
+            self._therm_dirty = set()
+            for idx in dirty:
+                temp = self.thermistor_temps[idx]
+                tag = self._therm_tags[idx]
+                if temp is not None and dpg.does_item_exist(tag):
+                    tenths = int(round(temp * 10))
+                    if -400 <= tenths <= 1250:
+                        temp_str = self._temp_strs[tenths + 400]
+                    else:
+                        temp_str = f"{temp:.1f}°C"
+                    # Only touch DPG for the parts that actually changed
+                    color = self._get_temp_color(temp)
+                    last = self._therm_last[idx]
+                    if last is None or last[0] != temp_str:
+                        dpg.set_value(tag, temp_str)
+                    if last is None or last[1] is not color:
+                        dpg.configure_item(tag, color=color)
+                    self._therm_last[idx] = (temp_str, color)
+
+        if self._cell_dirty:
+            dirty = self._cell_dirty
+            self._cell_dirty = set()
+            for idx in dirty:
+                voltage_mv = self.cell_voltages[idx]
+                tag = self._cell_tags[idx]
+                if voltage_mv is not None and dpg.does_item_exist(tag):
+                    voltage_v = voltage_mv / 1000.0
+                    mv = int(round(voltage_mv))
+                    if 0 <= mv <= 5000:
+                        volt_str = self._volt_strs[mv]
+                    else:
+                        volt_str = f"{voltage_v:.4f} V"
+                    # Only touch DPG for the parts that actually changed
+                    color = self._get_cell_voltage_color(voltage_v)
+                    last = self._cell_last[idx]
+                    if last is None or last[0] != volt_str:
+                        dpg.set_value(tag, volt_str)
+                    if last is None or last[1] is not color:
+                        dpg.configure_item(tag, color=color)
+                    self._cell_last[idx] = (volt_str, color)
+
     def _update_thermistor_stats(self):
         """Update thermistor statistics display for all modules."""
-        # Global stats (all modules)
-        all_temps = []
-        module_counts = [0] * 6  # Count active thermistors per module
-        
-        for module_id in range(6):
-            module_temps = [t for t in self.thermistor_temps[module_id] if t is not None]
-            all_temps.extend(module_temps)
-            module_counts[module_id] = len(module_temps)
-        
-        if not all_temps:
+        # Nothing changed since the last recompute - leave the line alone
+        if not self._therm_stats_dirty:
+            return
+        self._therm_stats_dirty = False
+
+        # Single pass over the flat array: no per-module slicing or
+        # intermediate filtered lists
+        module_counts = [0] * 6
+        active = 0
+        total = 0.0
+        min_t = max_t = None
+        for idx, t in enumerate(self.thermistor_temps):
+            if t is None:
+                continue
+            active += 1
+            module_counts[idx // 56] += 1
+            total += t
+            if min_t is None:
+                min_t = max_t = t
+            elif t < min_t:
+                min_t = t
+            elif t > max_t:
+                max_t = t
+
+        if not active:
             global_stats = "All Modules | Active: 0/336 | Min: --°C | Max: --°C | Avg: --°C"
         else:
-            active_global = len(all_temps)
-            min_global = min(all_temps)
-            max_global = max(all_temps)
-            avg_global = sum(all_temps) / len(all_temps)
-            
+            avg_t = total / active
             # Include per-module active counts
             module_str = " | ".join([f"M{i}:{module_counts[i]}" for i in range(6)])
-            global_stats = (f"Active: {active_global}/336 ({module_str}) | "
-                          f"Min: {min_global:.1f}°C | Max: {max_global:.1f}°C | Avg: {avg_global:.1f}°C")
-        
-        dpg.set_value("therm_global_stats", global_stats)
+            global_stats = (f"Active: {active}/336 ({module_str}) | "
+                          f"Min: {min_t:.1f}°C | Max: {max_t:.1f}°C | Avg: {avg_t:.1f}°C")
+
+        if global_stats != self._last_therm_stats:
+            self._last_therm_stats = global_stats
+            dpg.set_value("therm_global_stats", global_stats)
     
     def _clear_thermistor_data(self):
         """Clear all thermistor data from all modules."""
         # Clear stored data
-        self.thermistor_temps = [[None] * 56 for _ in range(6)]
-        
+        self.thermistor_temps = [None] * (6 * 56)
+        self._therm_dirty.clear()
+        self._therm_last = [None] * (6 * 56)
+        self._therm_stats_dirty = True
+
         # Clear all visible tags (all modules now visible)
-        for module_id in range(6):
-            for channel in range(56):
-                temp_tag = f"therm_m{module_id}_temp_{channel}"
-                if dpg.does_item_exist(temp_tag):
-                    dpg.set_value(temp_tag, "--.-°C")
-                    dpg.configure_item(temp_tag, color=(120, 220, 150))
-        
+        for temp_tag in self._therm_tags:
+            if dpg.does_item_exist(temp_tag):
+                dpg.set_value(temp_tag, "--.-°C")
+                dpg.configure_item(temp_tag, color=(120, 220, 150))
+
         self._update_thermistor_stats()
     
     
@@ -1631,136 +2168,74 @@ class PCANExplorerGUI:
         if not self.dbc_database:
             return
 
-        try:
-            # Decode the message using DBC - cantools auto-detects if extended
-            message = self.dbc_database.get_message_by_frame_id(can_id)
-            decoded = message.decode(data)
-            
-            current_time = datetime.now().strftime("%H:%M:%S")
-            
-            # Cell voltage messages for 6 modules × 18 cells
-            # Assuming messages follow pattern: Module_X_Cell_Voltages_Y_Z
-            # where X is module (0-5) and Y-Z indicates which cells (e.g., 1-6, 7-12, 13-18)
-            # Each message carries voltages for 6 cells (3 messages per module)
-            
-            # Parse cell voltage messages dynamically based on signal names
-            # Look for signals like "Cell_1_Voltage", "Cell_2_Voltage", etc.
-            for signal_name, signal_value in decoded.items():
-                if signal_name.startswith('Cell_') and signal_name.endswith('_Voltage'):
-                    try:
-                        # Extract cell number from signal name (e.g., "Cell_5_Voltage" -> 5)
-                        parts = signal_name.split('_')
-                        if len(parts) >= 3:
-                            cell_num_global = int(parts[1])  # Global cell number (1-108)
-                            
-                            # Map global cell number to module and cell index
-                            # Cells 1-18 -> Module 0, Cells 19-36 -> Module 1, etc.
-                            module_id = (cell_num_global - 1) // 18
-                            cell_idx = (cell_num_global - 1) % 18
-                            
-                            if 0 <= module_id < 6 and 0 <= cell_idx < 18:
-                                self._update_single_cell_voltage(module_id, cell_idx, signal_value, current_time)
-                    except (ValueError, IndexError):
-                        pass  # Skip malformed signal names
-            
-            # Legacy support: BQ76952 messages (if still present)
-            # BQ76952_Stack_Voltage (0x731/1841)
+        # Cell voltage IDs are stored as-is in the DBC; the dict gate
+        # rejects unrelated frames before any decode work or exception
+        # scope is entered
+        sig_map = self._cell_signal_maps.get(can_id)
+        if sig_map is None:
+            # BQ76952_Stack_Voltage (0x731/1841) carries no per-cell signals
             if can_id == 0x731:
-                if 'Stack_Voltage' in decoded:
-                    self.stack_voltage = decoded['Stack_Voltage']  # in mV
-            
-            # BQ76952_Cell_Voltages_1_4 (0x732/1842) - Cells 1-4 (Module 0, Cells 0-3)
-            elif can_id == 0x732:
-                for i in range(1, 5):
-                    key = f'Cell_{i}_Voltage'
-                    if key in decoded:
-                        module_id = 0
-                        cell_idx = i - 1
-                        self._update_single_cell_voltage(module_id, cell_idx, decoded[key], current_time)
-            
-            # BQ76952_Cell_Voltages_5_8 (0x733/1843) - Cells 5-8 (Module 0, Cells 4-7)
-            elif can_id == 0x733:
-                for i in range(5, 9):
-                    key = f'Cell_{i}_Voltage'
-                    if key in decoded:
-                        module_id = 0
-                        cell_idx = i - 1
-                        self._update_single_cell_voltage(module_id, cell_idx, decoded[key], current_time)
-            
-            # BQ76952_Cell_Voltages_9_12 (0x734/1844) - Cells 9-12 (Module 0, Cells 8-11)
-            elif can_id == 0x734:
-                for i in range(9, 13):
-                    key = f'Cell_{i}_Voltage'
-                    if key in decoded:
-                        module_id = 0
-                        cell_idx = i - 1
-                        self._update_single_cell_voltage(module_id, cell_idx, decoded[key], current_time)
-            
-            # BQ76952_Cell_Voltages_13_16 (0x735/1845) - Cells 13-16 (Module 0, Cells 12-15)
-            elif can_id == 0x735:
-                for i in range(13, 17):
-                    key = f'Cell_{i}_Voltage'
-                    if key in decoded:
-                        module_id = 0
-                        cell_idx = i - 1
-                        self._update_single_cell_voltage(module_id, cell_idx, decoded[key], current_time)
-            
+                decode = self._dbc_decode_by_id.get(can_id)
+                if decode is not None:
+                    try:
+                        decoded = decode(data)
+                    except Exception:
+                        return
+                    if 'Stack_Voltage' in decoded:
+                        self.stack_voltage = decoded['Stack_Voltage']  # in mV
+            return
+
+        try:
+            decoded = self._dbc_decode_by_id[can_id](data)
+
+            # Cell_N_Voltage signals use global numbering (1-108); the
+            # module/cell slot for each was precomputed at DBC load time.
+            # This also covers the legacy BQ76952 messages (0x732-0x735),
+            # whose cells 1-16 fall in module 0.
+            for signal_name, module_id, cell_idx in sig_map:
+                value = decoded.get(signal_name)
+                if value is not None:
+                    self._update_single_cell_voltage(module_id, cell_idx, value)
+
         except Exception as e:
-            # Message not in DBC or decode error - silently ignore
+            # Decode error - silently ignore
             pass
     
-    def _update_single_cell_voltage(self, module_id: int, cell_idx: int, voltage_mv: float, time_str: str):
+    def _update_single_cell_voltage(self, module_id: int, cell_idx: int, voltage_mv: float):
         """Update a single cell voltage display.
-        
+
         Args:
             module_id: Module ID (0-5)
             cell_idx: Cell index within module (0-17)
             voltage_mv: Voltage in millivolts
-            time_str: Timestamp string (not displayed in compact view)
         """
         if module_id < 0 or module_id >= 6 or cell_idx < 0 or cell_idx >= 18:
             return
-        
-        # Update stored value
-        self.cell_voltages[module_id][cell_idx] = voltage_mv
-        
-        voltage_v = voltage_mv / 1000.0
-        
-        # Update GUI
-        voltage_tag = f"cell_m{module_id}_v_{cell_idx}"
-        dpg.set_value(voltage_tag, f"{voltage_v:.4f} V")
-        
-        # Color based on voltage level
-        cell_color = self._get_cell_voltage_color(voltage_v)
-        dpg.configure_item(voltage_tag, color=cell_color)
-        
-        # Update statistics
-        self._update_cell_voltage_stats()
+
+        # Always store the reading so stats and CSV export see the latest
+        # value; the render loop compares the formatted text against what
+        # is already shown, so sub-resolution changes still cost nothing
+        # on the GUI side
+        idx = module_id * 18 + cell_idx
+        self.cell_voltages[idx] = voltage_mv
+        self._cell_dirty.add(idx)
+        self._cell_stats_dirty = True
     
-    def _get_cell_voltage_color(self, voltage: float):
+    @staticmethod
+    def _get_cell_voltage_color(voltage: float):
         """Get color for cell voltage display based on value."""
-        if voltage < 2.5:
-            return (255, 0, 0)      # Critical low - bright red
-        elif voltage < 3.0:
-            return (255, 100, 100)  # Very low - red
-        elif voltage < 3.3:
-            return (255, 200, 100)  # Low - orange
-        elif voltage < 4.2:
-            return (100, 255, 100)  # Normal - green
-        elif voltage < 4.3:
-            return (255, 255, 100)  # High - yellow
-        else:
-            return (255, 100, 255)  # Very high - magenta
+        return _VOLT_COLORS[bisect.bisect_right(_VOLT_THRESHOLDS, voltage)]
     
     def _update_cell_voltage_stats(self):
         """Update cell voltage statistics display for all 108 cells across 6 modules."""
+        # Nothing changed since the last recompute - leave the line alone
+        if not self._cell_stats_dirty:
+            return
+        self._cell_stats_dirty = False
+
         # Flatten all cell voltages
-        valid_voltages = []
-        for module in self.cell_voltages:
-            for v in module:
-                if v is not None:
-                    valid_voltages.append(v)
-        
+        valid_voltages = [v for v in self.cell_voltages if v is not None]
+
         # Calculate stack voltage from sum of cells
         stack_v = sum(valid_voltages) / 1000.0 if valid_voltages else 0.0
         
@@ -1774,20 +2249,23 @@ class PCANExplorerGUI:
             delta_v = (max_v - min_v)
             stats_text = f"Active: {active}/108 | Stack: {stack_v:.3f} V | Min: {min_v:.4f} V | Max: {max_v:.4f} V | Avg: {avg_v:.4f} V | Delta: {delta_v:.4f} V"
         
-        dpg.set_value("cell_stats", stats_text)
+        if stats_text != self._last_cell_stats:
+            self._last_cell_stats = stats_text
+            dpg.set_value("cell_stats", stats_text)
     
     def _clear_cell_voltage_data(self):
         """Clear all cell voltage data for all 108 cells."""
-        self.cell_voltages = [[None] * 18 for _ in range(6)]
+        self.cell_voltages = [None] * (6 * 18)
+        self._cell_dirty.clear()
+        self._cell_last = [None] * (6 * 18)
+        self._cell_stats_dirty = True
         self.stack_voltage = None
-        
+
         # Clear individual cells for all modules
-        for module_id in range(6):
-            for cell_idx in range(18):
-                voltage_tag = f"cell_m{module_id}_v_{cell_idx}"
-                dpg.set_value(voltage_tag, "-.---- V")
-                dpg.configure_item(voltage_tag, color=(100, 255, 180))  # Vibrant mint green
-        
+        for voltage_tag in self._cell_tags:
+            dpg.set_value(voltage_tag, "-.---- V")
+            dpg.configure_item(voltage_tag, color=(100, 255, 180))  # Vibrant mint green
+
         self._update_cell_voltage_stats()
     
     def _export_cell_voltage_data(self):
@@ -1796,33 +2274,29 @@ class PCANExplorerGUI:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"cell_voltages_{timestamp}.csv"
             
-            with open(filename, 'w') as f:
-                f.write("Module,Cell_Index,Cell_Label,Voltage_V,Voltage_mV,Status\n")
-                
-                # Calculate stack voltage
-                valid_voltages = []
-                for module in self.cell_voltages:
-                    for v in module:
-                        if v is not None:
-                            valid_voltages.append(v)
-                
-                stack_v = sum(valid_voltages) / 1000.0 if valid_voltages else 0.0
-                stack_mv = sum(valid_voltages) if valid_voltages else 0.0
-                
+            # One walk over the grid builds the rows and accumulates the
+            # stack voltage at the same time
+            rows = []
+            stack_mv = 0.0
+            for module_id in range(6):
+                base = module_id * 18
+                for cell_idx in range(18):
+                    voltage_mv = self.cell_voltages[base + cell_idx]
+                    cell_label = f"M{module_id}_C{cell_idx + 1}"
+                    if voltage_mv is not None:
+                        stack_mv += voltage_mv
+                        rows.append((module_id, cell_idx, cell_label,
+                                     f"{voltage_mv / 1000.0:.4f}", f"{voltage_mv:.0f}", "Active"))
+                    else:
+                        rows.append((module_id, cell_idx, cell_label, "", "", "No Data"))
+
+            with open(filename, 'w', newline='', buffering=1 << 16) as f:
+                writer = csv.writer(f)
+                writer.writerow(("Module", "Cell_Index", "Cell_Label", "Voltage_V", "Voltage_mV", "Status"))
                 # Stack voltage summary
-                f.write(f"ALL,ALL,Stack,{stack_v:.3f},{stack_mv:.0f},Active\n")
-                f.write("\n")
-                
-                # Individual cells for each module
-                for module_id in range(6):
-                    for cell_idx in range(18):
-                        voltage_mv = self.cell_voltages[module_id][cell_idx]
-                        cell_label = f"M{module_id}_C{cell_idx+1}"
-                        if voltage_mv is not None:
-                            voltage_v = voltage_mv / 1000.0
-                            f.write(f"{module_id},{cell_idx},{cell_label},{voltage_v:.4f},{voltage_mv:.0f},Active\n")
-                        else:
-                            f.write(f"{module_id},{cell_idx},{cell_label},,,No Data\n")
+                writer.writerow(("ALL", "ALL", "Stack", f"{stack_mv / 1000.0:.3f}", f"{stack_mv:.0f}", "Active"))
+                writer.writerow(())
+                writer.writerows(rows)
             
             self._show_popup("Export Success", f"Saved: {filename}")
         except Exception as e:
@@ -1845,13 +2319,31 @@ class PCANExplorerGUI:
         """Run the GUI application."""
         self.setup_gui()
         
-        # Main render loop
+        # Main render loop - repaint dirty table rows at ~30 Hz so GUI work
+        # stays bounded by refresh rate even on a busy bus
+        next_table_update = 0.0
         while dpg.is_dearpygui_running():
+            now = time.monotonic()
             if self.is_connected:
+                self._drain_rx_queue()
+            if self.is_connected and now >= next_table_update:
                 self._update_message_table()
+                # Monitor cells and statistics are refreshed here once per
+                # tick instead of once per incoming signal update
+                self._refresh_monitor_cells()
+                self._update_thermistor_stats()
+                self._update_cell_voltage_stats()
+                next_table_update = now + 0.033
+            # Coalesce send-table edits (adds, removes, TX count bumps)
+            # into at most one listbox rebuild per frame
+            if self._send_table_dirty:
+                self._send_table_dirty = False
+                self._update_send_messages_table()
+            self._flush_config_save(now)
             dpg.render_dearpygui_frame()
-        
-        # Cleanup
+
+        # Cleanup - flush any pending config write before shutdown
+        self._flush_config_save()
         if self.is_connected:
             self.driver.disconnect()
         
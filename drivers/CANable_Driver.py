@@ -88,6 +88,14 @@ GS_USB_DEVICES = [
     (0x16D0, 0x0F67),  # candleLight
 ]
 
+# (vid, pid, bus, address) -> (monotonic timestamp, (manufacturer, product,
+# serial)) descriptor strings, filled on the first full enumeration of each
+# device. Entries expire after the TTL and are evicted when the device
+# disappears from a scan, so swapping in another unit that re-enumerates at
+# the same bus/address cannot serve the old unit's strings forever.
+_USB_STRING_CACHE = {}
+_USB_STRING_CACHE_TTL = 60.0  # seconds
+
 
 @dataclass
 class CANMessage:
@@ -182,10 +190,16 @@ class CANableDriver:
         else:
             self._libusb_backend = None
         
-    def get_available_devices(self) -> List[dict]:
+    def get_available_devices(self, fetch_strings: bool = True) -> List[dict]:
         """
         Scan for available CANable devices using USB enumeration.
         
+        Args:
+            fetch_strings: Read manufacturer/product/serial string
+                           descriptors (each one is a synchronous USB
+                           control transfer). Pass False for a fast scan
+                           that only needs index/VID/PID.
+        
         Returns:
             List of dictionaries containing device information.
             Each device has: index, vid, pid, manufacturer, product, serial, bus, address
@@ -203,19 +217,34 @@ class CANableDriver:
             
             # Find all gs_usb compatible devices
             device_index = 0
+            now = time.monotonic()
+            seen_keys = set()
             for vid, pid in GS_USB_DEVICES:
                 devices = usb.core.find(find_all=True, backend=backend, idVendor=vid, idProduct=pid)
-                
+
                 for dev in devices:
-                    try:
-                        # Get device information
-                        manufacturer = usb.util.get_string(dev, dev.iManufacturer) if dev.iManufacturer else "Unknown"
-                        product = usb.util.get_string(dev, dev.iProduct) if dev.iProduct else "Unknown"
-                        serial = usb.util.get_string(dev, dev.iSerialNumber) if dev.iSerialNumber else "Unknown"
-                    except:
+                    # String descriptors are cached per physical device so
+                    # the control transfers are only paid once per TTL
+                    cache_key = (vid, pid, dev.bus, dev.address)
+                    seen_keys.add(cache_key)
+                    cached = _USB_STRING_CACHE.get(cache_key)
+                    if cached is not None and now - cached[0] <= _USB_STRING_CACHE_TTL:
+                        manufacturer, product, serial = cached[1]
+                    elif not fetch_strings:
                         manufacturer = "Unknown"
                         product = "Unknown"
                         serial = "Unknown"
+                    else:
+                        try:
+                            # Get device information
+                            manufacturer = usb.util.get_string(dev, dev.iManufacturer) if dev.iManufacturer else "Unknown"
+                            product = usb.util.get_string(dev, dev.iProduct) if dev.iProduct else "Unknown"
+                            serial = usb.util.get_string(dev, dev.iSerialNumber) if dev.iSerialNumber else "Unknown"
+                        except:
+                            manufacturer = "Unknown"
+                            product = "Unknown"
+                            serial = "Unknown"
+                        _USB_STRING_CACHE[cache_key] = (now, (manufacturer, product, serial))
                     
                     device_info = {
                         'index': device_index,
@@ -233,7 +262,12 @@ class CANableDriver:
                     
                     available_devices.append(device_info)
                     device_index += 1
-            
+
+            # Devices gone from this scan free their cache slots right away
+            for key in list(_USB_STRING_CACHE):
+                if key not in seen_keys:
+                    del _USB_STRING_CACHE[key]
+
             if not available_devices:
                 print("ℹ No CANable/gs_usb devices found")
                 print("  Make sure:")
@@ -464,7 +498,80 @@ class CANableDriver:
             if self._is_connected:
                 print(f"[ERROR] Failed to send message: {str(e)}")
             return False
-    
+
+    def send_batch(self, messages: List[CANMessage]) -> int:
+        """
+        Send multiple CAN messages back-to-back in one tight loop.
+
+        Avoids the per-call overhead of send_message() when streaming many
+        frames (e.g. firmware flashing).
+
+        Args:
+            messages: List of CANMessage objects to send in order.
+
+        Returns:
+            Number of messages successfully queued for transmission.
+        """
+        if not self._is_connected or self._bus is None:
+            print("[ERROR] Not connected to CANable device")
+            return 0
+
+        bus_send = self._bus.send
+        sent = 0
+        try:
+            for msg in messages:
+                bus_send(Message(
+                    arbitration_id=msg.id,
+                    data=msg.data,
+                    is_extended_id=msg.is_extended,
+                    is_remote_frame=msg.is_remote
+                ))
+                sent += 1
+        except Exception as e:
+            if self._is_connected:
+                print(f"[ERROR] Batch send failed after {sent} messages: {str(e)}")
+
+        return sent
+
+    def set_filter(self, from_id: int, to_id: int, is_extended: bool = False) -> bool:
+        """
+        Set an acceptance filter for received messages.
+
+        The filter is applied at the python-can/kernel layer, so frames
+        outside the range are dropped before they reach this driver. Like
+        hardware acceptance filters, a range is widened to the smallest
+        covering ID/mask pair, so a superset of the range may pass.
+
+        Args:
+            from_id: Start of ID range
+            to_id: End of ID range
+            is_extended: Filter for extended IDs (default: False)
+
+        Returns:
+            True if filter set successfully, False otherwise.
+        """
+        if not self._is_connected or self._bus is None:
+            print("[ERROR] Not connected to CANable device")
+            return False
+
+        try:
+            mask = 0x1FFFFFFF if is_extended else 0x7FF
+            diff = from_id ^ to_id
+            if diff:
+                mask &= ~((1 << diff.bit_length()) - 1)
+
+            self._bus.set_filters([{
+                "can_id": from_id & mask,
+                "can_mask": mask,
+                "extended": is_extended
+            }])
+            print(f"[OK] Filter set: 0x{from_id:X} - 0x{to_id:X}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to set filter: {str(e)}")
+            return False
+
     def read_message(self, timeout: float = 1.0) -> Optional[CANMessage]:
         """
         Read a CAN message from the bus.
@@ -143,12 +143,18 @@ class FirmwareFlasher:
         Skips READY/heartbeat messages (0x14 0x01 0x00...) during normal operations.
         """
         print(f"[DEBUG] _wait_response: waiting up to {timeout}s for response...")
-        start_time = time.time()
+        # Block in the driver for the full remaining time instead of polling
+        # in 0.1s slices - the OS wakes us exactly when a frame arrives
+        start_time = time.monotonic()
+        deadline = start_time + timeout
         msg_count = 0
         heartbeat_count = 0
-        
-        while (time.time() - start_time) < timeout:
-            msg = self.driver.read_message(timeout=0.1)
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            msg = self.driver.read_message(timeout=remaining)
             if msg and msg.id == CAN_BOOTLOADER_ID:
                 msg_count += 1
                 # Log every message we see for debugging
@@ -156,8 +162,8 @@ class FirmwareFlasher:
                     data_hex = ' '.join([f"{b:02X}" for b in msg.data])
                 except Exception:
                     data_hex = str(msg.data)
-                
-                elapsed = time.time() - start_time
+
+                elapsed = time.monotonic() - start_time
                 print(f"[DEBUG] _wait_response saw (t={elapsed:.2f}s, msg#{msg_count}): ID=0x{msg.id:X}, Data=[{data_hex}]")
 
                 # Skip the canonical heartbeat message (READY 0x14 0x01 0x00)
@@ -201,9 +207,12 @@ class FirmwareFlasher:
             return False
 
         # Wait for bootloader READY message
-        start_time = time.time()
-        while (time.time() - start_time) < 3.0:
-            msg = self.driver.read_message(timeout=0.1)
+        deadline = time.monotonic() + 3.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            msg = self.driver.read_message(timeout=remaining)
             if msg and msg.id == CAN_BOOTLOADER_ID:
                 if len(msg.data) > 0 and msg.data[0] == RESP_READY:
                     version = msg.data[1] if len(msg.data) > 1 else 0
@@ -283,12 +292,14 @@ class FirmwareFlasher:
         # We need to wait through heartbeats to get the actual ACK response
         # Try for up to 15 seconds, skipping heartbeats
         print(f"[DEBUG] set_address: Waiting for ACK response...")
-        start_time = time.time()
-        max_wait = 15.0
-        
-        while (time.time() - start_time) < max_wait:
-            msg = self.driver.read_message(timeout=0.1)
-            
+        deadline = time.monotonic() + 15.0
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            msg = self.driver.read_message(timeout=remaining)
+
             if msg and msg.id == CAN_BOOTLOADER_ID:
                 # Log every message
                 try:
@@ -341,10 +352,12 @@ class FirmwareFlasher:
     def read_pending_acks(self, expected_count: int, timeout: float = 0.5) -> int:
         """Read multiple pending ACK responses"""
         ack_count = 0
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while ack_count < expected_count and (time.time() - start_time) < timeout:
-            remaining_time = timeout - (time.time() - start_time)
+        while ack_count < expected_count:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
             resp = self._wait_response(timeout=min(0.05, remaining_time))
 
             if not resp:
@@ -387,15 +400,17 @@ class FirmwareFlasher:
         bytes_written = 0
         chunks_in_batch = 0
         start_time = time.time()
+        last_report = 0.0
 
-        while bytes_written < total_bytes:
-            # Get next 4-byte chunk
-            chunk_end = min(bytes_written + chunk_size, total_bytes)
-            chunk = firmware_data[bytes_written:chunk_end]
+        # Pad once up front in a single allocation so the loop never has to
+        # branch on (or re-allocate for) a short final chunk
+        if total_bytes % chunk_size:
+            padded_len = (total_bytes + chunk_size - 1) & ~(chunk_size - 1)
+            firmware_data = firmware_data.ljust(padded_len, b'\xFF')
 
-            # Pad if needed
-            if len(chunk) < 4:
-                chunk = chunk + b'\xFF' * (4 - len(chunk))
+        while bytes_written < total_bytes:
+            # Get next 4-byte chunk (always full-width thanks to the pad)
+            chunk = firmware_data[bytes_written:bytes_written + chunk_size]
 
             # Send without waiting for ACK
             is_last_chunk = (bytes_written + chunk_size >= total_bytes)
@@ -405,7 +420,7 @@ class FirmwareFlasher:
                 self._report_progress('error', 0, f'Write failed at offset 0x{bytes_written:08X}')
                 return False
 
-            bytes_written += len(chunk) if chunk_end != total_bytes or len(chunk) == 4 else (chunk_end - bytes_written)
+            bytes_written = min(bytes_written + chunk_size, total_bytes)
             chunks_in_batch += 1
 
             # Check batched ACKs
@@ -417,13 +432,17 @@ class FirmwareFlasher:
                     return False
                 chunks_in_batch = 0
 
-            # Update progress
-            progress = int((bytes_written * 100) / total_bytes)
-            elapsed = time.time() - start_time
-            speed = bytes_written / elapsed / 1024 if elapsed > 0 else 0
-            self._report_progress('write', progress, 
-                                f'Writing: {speed:.1f} KB/s', 
-                                bytes_written, total_bytes)
+            # Update progress (throttled to ~10 reports/sec so GUI updates
+            # and console output stay off the per-chunk critical path)
+            now = time.monotonic()
+            if now - last_report > 0.1:
+                last_report = now
+                progress = int((bytes_written * 100) / total_bytes)
+                elapsed = time.time() - start_time
+                speed = bytes_written / elapsed / 1024 if elapsed > 0 else 0
+                self._report_progress('write', progress, 
+                                    f'Writing: {speed:.1f} KB/s', 
+                                    bytes_written, total_bytes)
 
         elapsed = time.time() - start_time
         avg_speed = total_bytes / elapsed / 1024 if elapsed > 0 else 0
@@ -440,6 +459,7 @@ class FirmwareFlasher:
         bytes_verified = 0
         chunk_size = 7  # Max per CAN message
         start_time = time.time()
+        last_report = 0.0
 
         while bytes_verified < len(expected_data):
             batch_reads = []
@@ -495,13 +515,16 @@ class FirmwareFlasher:
 
             address = current_address
 
-            # Update progress
-            progress = int((bytes_verified * 100) / len(expected_data))
-            elapsed = time.time() - start_time
-            speed = bytes_verified / elapsed / 1024 if elapsed > 0 else 0
-            self._report_progress('verify', progress, 
-                                f'Verifying: {speed:.1f} KB/s', 
-                                bytes_verified, len(expected_data))
+            # Update progress (throttled to ~10 reports/sec)
+            now = time.monotonic()
+            if now - last_report > 0.1:
+                last_report = now
+                progress = int((bytes_verified * 100) / len(expected_data))
+                elapsed = time.time() - start_time
+                speed = bytes_verified / elapsed / 1024 if elapsed > 0 else 0
+                self._report_progress('verify', progress, 
+                                    f'Verifying: {speed:.1f} KB/s', 
+                                    bytes_verified, len(expected_data))
 
         self._report_progress('verify', 100, 'Verification successful', 
                             len(expected_data), len(expected_data))
@@ -570,12 +593,11 @@ class FirmwareFlasher:
             # Pad to 4-byte boundary
             firmware_data = self.pad_to_4byte_boundary(firmware_data)
 
-            # Reset module
+            # Reset module (blocks until the bootloader's READY message arrives,
+            # so no extra settling delay is needed before erasing)
             if not self.send_reset_message(module_number):
                 return False
 
-            time.sleep(0.5)  # Brief delay after reset
-
             # Erase flash
             if not self.erase_flash():
                 return False
@@ -20,25 +20,28 @@ Date: October 15, 2025
 
 import sys
 import time
+import queue
+import importlib.util
+import mmap
+import zlib
+import struct
 import argparse
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple, Union
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
-# Import both drivers
-try:
-    from PCAN_Driver import PCANDriver, PCANChannel, PCANBaudRate, CANMessage as PCANMessage
-    PCAN_AVAILABLE = True
-except ImportError:
-    PCAN_AVAILABLE = False
+# Driver modules are imported lazily once an adapter type is selected, so a
+# PCAN run never pays for the CANable/USB stack (and vice versa). Up front we
+# only check which drivers are installed for the availability warnings.
+PCAN_AVAILABLE = importlib.util.find_spec("PCAN_Driver") is not None
+if not PCAN_AVAILABLE:
     print("Warning: PCAN_Driver not available")
 
-try:
-    from CANable_Driver import CANableDriver, CANableBaudRate, CANMessage as CANableMessage
-    CANABLE_AVAILABLE = True
-except ImportError:
-    CANABLE_AVAILABLE = False
+CANABLE_AVAILABLE = importlib.util.find_spec("CANable_Driver") is not None
+if not CANABLE_AVAILABLE:
     print("Warning: CANable_Driver not available")
 
 
@@ -96,18 +99,70 @@ class CANAdapter(ABC):
         """Clear the receive queue"""
         pass
 
+    def send_batch(self, messages: list) -> int:
+        """Send multiple CAN messages; returns the number sent.
+
+        Default implementation loops over send_message(); adapters whose
+        drivers support batched transmission should override this.
+        """
+        sent = 0
+        for msg in messages:
+            if not self.send_message(msg.id, msg.data, msg.is_extended):
+                break
+            sent += 1
+        return sent
+
+
+# Device-enumeration cache: USB/WMI scans are the dominant startup cost on
+# Windows, and one CLI run can otherwise enumerate twice (listing + connect)
+_ENUM_CACHE: dict = {}
+_ENUM_CACHE_TTL = 3.0  # seconds
+
+
+def _cached_devices(device_type: str, driver, ttl: float = _ENUM_CACHE_TTL) -> list:
+    """Return driver.get_available_devices(), cached per adapter type."""
+    now = time.monotonic()
+    cached = _ENUM_CACHE.get(device_type)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    devices = driver.get_available_devices()
+    _ENUM_CACHE[device_type] = (now, devices)
+    return devices
+
+
+def _baud_name(baudrate_kbps: int) -> str:
+    """Map a kbps value to the BAUD_* member name both driver enums share."""
+    return 'BAUD_1M' if baudrate_kbps == 1000 else f'BAUD_{baudrate_kbps}K'
+
 
 class PCANAdapter(CANAdapter):
     """Adapter wrapper for PCAN driver"""
 
-    def __init__(self, channel: str):
+    def __init__(self, channel: str, fd_mode: bool = False, baudrate_kbps: int = 500):
         if not PCAN_AVAILABLE:
             raise RuntimeError("PCAN driver not available")
+        try:
+            from PCAN_Driver import (PCANDriver, PCANChannel, PCANBaudRate,
+                                     PCAN_CHANNEL_NAMES)
+        except ImportError as e:
+            # find_spec only proves the module file exists; its own imports
+            # (python-can etc.) can still be missing
+            raise RuntimeError(f"PCAN driver not available ({e})")
         self.driver = PCANDriver()
+        if channel not in PCAN_CHANNEL_NAMES:
+            raise ValueError(f"Unknown PCAN channel '{channel}' (expected USB1-USB16)")
         self.channel = PCANChannel[channel]
+        self.baudrate = PCANBaudRate[_baud_name(baudrate_kbps)]
+        self.fd_mode = fd_mode
 
     def connect(self) -> bool:
-        return self.driver.connect(self.channel, PCANBaudRate.BAUD_500K)
+        if not self.driver.connect(self.channel, self.baudrate, fd_mode=self.fd_mode):
+            return False
+        # Accept only bootloader responses so unrelated bus traffic is
+        # dropped in the driver instead of being filtered here frame by
+        # frame (best effort - flashing works without the filter too)
+        self.driver.set_filter(CAN_BOOTLOADER_ID, CAN_BOOTLOADER_ID, is_extended=True)
+        return True
 
     def disconnect(self):
         self.driver.disconnect()
@@ -134,18 +189,34 @@ class PCANAdapter(CANAdapter):
     def clear_receive_queue(self) -> bool:
         return self.driver.clear_receive_queue()
 
+    def send_batch(self, messages: list) -> int:
+        # Driver message type is structurally identical, pass straight through
+        return self.driver.send_batch(messages)
+
 
 class CANableAdapter(CANAdapter):
     """Adapter wrapper for CANable driver"""
 
-    def __init__(self, channel: int):
+    def __init__(self, channel: int, fd_mode: bool = False, baudrate_kbps: int = 500):
         if not CANABLE_AVAILABLE:
             raise RuntimeError("CANable driver not available")
+        try:
+            from CANable_Driver import CANableDriver, CANableBaudRate
+        except ImportError as e:
+            # find_spec only proves the module file exists; its own imports
+            # (pyusb, python-can) can still be missing
+            raise RuntimeError(f"CANable driver not available ({e})")
         self.driver = CANableDriver()
         self.channel = channel
+        self.baudrate = CANableBaudRate[_baud_name(baudrate_kbps)]
+        self.fd_mode = fd_mode
 
     def connect(self) -> bool:
-        return self.driver.connect(self.channel, CANableBaudRate.BAUD_500K)
+        if not self.driver.connect(self.channel, self.baudrate, fd_mode=self.fd_mode):
+            return False
+        # Same driver-level acceptance filter as the PCAN path
+        self.driver.set_filter(CAN_BOOTLOADER_ID, CAN_BOOTLOADER_ID, is_extended=True)
+        return True
 
     def disconnect(self):
         self.driver.disconnect()
@@ -172,6 +243,10 @@ class CANableAdapter(CANAdapter):
     def clear_receive_queue(self) -> bool:
         return self.driver.clear_receive_queue()
 
+    def send_batch(self, messages: list) -> int:
+        # Driver message type is structurally identical, pass straight through
+        return self.driver.send_batch(messages)
+
 
 # ============================================================================
 # Bootloader Protocol Constants
@@ -189,6 +264,7 @@ CMD_JUMP_TO_APP = 0x04
 CMD_GET_STATUS = 0x05
 CMD_SET_ADDRESS = 0x06
 CMD_WRITE_DATA = 0x07
+CMD_VERIFY_CRC = 0x08
 
 # Responses
 RESP_ACK = 0x10
@@ -197,6 +273,7 @@ RESP_ERROR = 0x12
 RESP_BUSY = 0x13
 RESP_READY = 0x14
 RESP_DATA = 0x15
+RESP_CRC = 0x16
 
 # Error Codes
 ERR_NONE = 0x00
@@ -211,44 +288,68 @@ ERR_TIMEOUT = 0x07
 # Memory Configuration
 APP_START_ADDRESS = 0x08008000
 APP_MAX_SIZE = 208 * 1024  # 208 KB (last 16KB reserved for permanent storage)
+FLASH_PAGE_SIZE = 2048     # STM32L432 flash page size (erase granularity)
 
 # Timing
 RESPONSE_TIMEOUT = 1.0       # Normal response timeout (seconds)
 ERASE_TIMEOUT = 15.0         # Flash erase timeout (seconds)
+# Note on CAN FD: 64-byte FD payloads would cut per-frame overhead ~15x, but
+# the STM32L432 bootloader sits on a bxCAN peripheral (classic CAN only), so
+# the wire protocol is fixed at 8-byte frames. --fd only affects how the host
+# adapter is opened.
 WRITE_CHUNK_SIZE = 4         # Write 4 bytes per CAN message (bootloader buffers 2 chunks for 8-byte flash write)
+WRITE_WINDOW = 16            # CMD_WRITE_DATA frames in flight before draining ACKs
+                             # (64 bytes/window: small enough for bxCAN's RX
+                             # FIFOs, large enough to keep the bus saturated)
+MAX_WRITE_REWINDS = 3        # NACK recovery attempts before giving up
 
 
 # ============================================================================
 # Error Code Descriptions
 # ============================================================================
 
-ERROR_DESCRIPTIONS = {
-    ERR_NONE: "No error",
-    ERR_INVALID_COMMAND: "Invalid command",
-    ERR_INVALID_ADDRESS: "Invalid address",
-    ERR_FLASH_ERASE_FAILED: "Flash erase failed",
-    ERR_FLASH_WRITE_FAILED: "Flash write failed",
-    ERR_INVALID_DATA_LENGTH: "Invalid data length",
-    ERR_NO_VALID_APP: "No valid application",
-    ERR_TIMEOUT: "Operation timeout"
-}
+# Error codes are dense small integers (0x00-0x07), so a tuple indexed by
+# code beats hashing into a dict on every status/error print
+ERROR_DESCRIPTIONS = (
+    "No error",             # ERR_NONE
+    "Invalid command",      # ERR_INVALID_COMMAND
+    "Invalid address",      # ERR_INVALID_ADDRESS
+    "Flash erase failed",   # ERR_FLASH_ERASE_FAILED
+    "Flash write failed",   # ERR_FLASH_WRITE_FAILED
+    "Invalid data length",  # ERR_INVALID_DATA_LENGTH
+    "No valid application", # ERR_NO_VALID_APP
+    "Operation timeout"     # ERR_TIMEOUT
+)
+
+
+def error_description(error_code: int) -> str:
+    """Describe a bootloader error code."""
+    if 0 <= error_code < len(ERROR_DESCRIPTIONS):
+        return ERROR_DESCRIPTIONS[error_code]
+    return f"Error {error_code}"
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+# Bootloader state names indexed by state code
+_STATE_NAMES = ('IDLE', 'ERASING', 'WRITING', 'READING', 'VERIFYING', 'JUMPING')
+
+
+@dataclass(frozen=True)
 class BootloaderStatus:
     """Bootloader status information"""
+    # __slots__ set manually; dataclass(slots=...) needs Python 3.10 and
+    # the project supports 3.8+
+    __slots__ = ('state', 'error', 'bytes_written')
     state: int
     error: int
     bytes_written: int
-    
+
     def __str__(self):
-        states = ['IDLE', 'ERASING', 'WRITING', 'READING', 'VERIFYING', 'JUMPING']
-        state_name = states[self.state] if self.state < len(states) else 'UNKNOWN'
-        error_desc = ERROR_DESCRIPTIONS.get(self.error, f'Unknown error {self.error}')
+        state_name = _STATE_NAMES[self.state] if self.state < len(_STATE_NAMES) else 'UNKNOWN'
+        error_desc = error_description(self.error)
         return f"State: {state_name}, Error: {error_desc}, Bytes Written: {self.bytes_written}"
 
 
@@ -271,6 +372,16 @@ class CANBootloaderFlash:
         self.driver = adapter
         self.connected = False
         self.verbose = True
+        self.response_timeout = RESPONSE_TIMEOUT  # Tunable per instance
+        # Reused WRITE_DATA frame template: [CMD] [len=4] [data x4] [pad x2].
+        # The command and length bytes never change, so hot paths only
+        # overwrite bytes 2..5
+        self._tx_buf = bytearray(8)
+        self._tx_buf[0] = CMD_WRITE_DATA
+        self._tx_buf[1] = 0x04
+        self._rx_q: queue.Queue = queue.Queue()
+        self._rx_stop = threading.Event()
+        self._rx_thread: Optional[threading.Thread] = None
         
     def connect(self) -> bool:
         """
@@ -293,6 +404,13 @@ class CANBootloaderFlash:
         # Clear receive queue
         self.driver.clear_receive_queue()
 
+        # Start the background reader: it continuously drains the driver
+        # into _rx_q so frames arriving between commands are never dropped
+        # and wait_response() becomes a simple queue get
+        self._rx_stop.clear()
+        self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True)
+        self._rx_thread.start()
+
         print("✓ Connected successfully")
 
         # Wait for bootloader READY message
@@ -304,8 +422,46 @@ class CANBootloaderFlash:
     def disconnect(self):
         """Disconnect from CAN device."""
         if self.connected:
+            self._rx_stop.set()
+            if self._rx_thread is not None:
+                self._rx_thread.join(timeout=1.0)
+                self._rx_thread = None
             self.driver.disconnect()
             self.connected = False
+
+    def _rx_loop(self):
+        """Background reader: drain the driver into the RX queue.
+
+        Reception runs decoupled from transmission, so pipelined ACKs and
+        unsolicited messages queue up here instead of sitting in (or
+        overflowing) the driver's receive buffer.
+        """
+        # The short slice only bounds how quickly the stop flag is seen;
+        # recv() returns the moment a frame arrives regardless, and some
+        # python-can backends implement the timeout as an internal poll,
+        # so keeping it small also tightens worst-case ACK latency there
+        while not self._rx_stop.is_set():
+            msg = self.driver.read_message(timeout=0.005)
+            if msg and msg.id == CAN_BOOTLOADER_ID:
+                self._rx_q.put(msg)
+
+    @contextmanager
+    def _quiet(self):
+        """Temporarily silence verbose diagnostics (for tight loops)."""
+        old_verbose = self.verbose
+        self.verbose = False
+        try:
+            yield
+        finally:
+            self.verbose = old_verbose
+
+    def _clear_rx_queue(self):
+        """Drop any queued responses (e.g. stale ACKs before a rewind)."""
+        try:
+            while True:
+                self._rx_q.get_nowait()
+        except queue.Empty:
+            pass
     
     def send_command(self, command: int, data: list) -> bool:
         """
@@ -318,33 +474,32 @@ class CANBootloaderFlash:
         Returns:
             True if sent successfully
         """
-        # Prepare message (pad to 8 bytes)
-        msg_data = [command] + data
-        while len(msg_data) < 8:
-            msg_data.append(0x00)
+        # Build the zero-padded 8-byte frame in one allocation instead of
+        # a Python append loop
+        frame = bytearray(8)
+        frame[0] = command
+        frame[1:1 + min(len(data), 7)] = bytes(data[:7])
         
         # Send to bootloader (use extended 29-bit ID)
-        return self.driver.send_message(CAN_HOST_ID, bytes(msg_data[:8]), is_extended=True)
+        return self.driver.send_message(CAN_HOST_ID, bytes(frame), is_extended=True)
     
-    def wait_response(self, timeout: float = RESPONSE_TIMEOUT) -> Optional[CANMessage]:
+    def wait_response(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
         """
         Wait for a response from bootloader.
         
         Args:
             timeout: Maximum time to wait in seconds
+                     (default: self.response_timeout)
         
         Returns:
             CANMessage if received, None if timeout
         """
-        start_time = time.time()
-        
-        while (time.time() - start_time) < timeout:
-            msg = self.driver.read_message(timeout=0.1)
-            
-            if msg and msg.id == CAN_BOOTLOADER_ID:
-                return msg
-        
-        return None
+        if timeout is None:
+            timeout = self.response_timeout
+        try:
+            return self._rx_q.get(timeout=timeout)
+        except queue.Empty:
+            return None
     
     def wait_for_bootloader_ready(self, timeout: float = 3.0) -> bool:
         """
@@ -363,12 +518,15 @@ class CANBootloaderFlash:
         if self.verbose:
             print("Waiting for bootloader READY message...")
         
-        start_time = time.time()
-        
-        while (time.time() - start_time) < timeout:
-            msg = self.driver.read_message(timeout=0.1)
-            
-            if msg and msg.id == CAN_BOOTLOADER_ID:
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            msg = self.wait_response(timeout=remaining)
+
+            if msg:
                 if len(msg.data) > 0 and msg.data[0] == RESP_READY:
                     version = msg.data[1] if len(msg.data) > 1 else 0
                     if self.verbose:
@@ -392,26 +550,28 @@ class CANBootloaderFlash:
         # Send GET_STATUS command
         if not self.send_command(CMD_GET_STATUS, []):
             return None
-        
-        # Wait for response
-        resp = self.wait_response()
-        if not resp or len(resp.data) < 7:
-            if self.verbose:
-                print("✗ No response or invalid response")
-            return None
-        
-        # Parse response
-        if resp.data[0] == RESP_DATA:
-            status = BootloaderStatus(
-                state=resp.data[1],
-                error=resp.data[2],
-                bytes_written=(resp.data[3] << 24) | (resp.data[4] << 16) | 
-                              (resp.data[5] << 8) | resp.data[6]
-            )
-            if self.verbose:
-                print(f"✓ {status}")
-            return status
-        
+
+        # Wait for the RESP_DATA reply, skipping unrelated frames until the
+        # timeout expires. After a NACK rewind, ACKs for frames sent before
+        # the NACK'd one can still be in flight behind _clear_rx_queue();
+        # those stragglers must not be mistaken for the status response.
+        deadline = time.monotonic() + self.response_timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            resp = self.wait_response(timeout=remaining)
+            if not resp:
+                break
+            if len(resp.data) >= 7 and resp.data[0] == RESP_DATA:
+                status = BootloaderStatus(
+                    state=resp.data[1],
+                    error=resp.data[2],
+                    bytes_written=int.from_bytes(resp.data[3:7], 'big')
+                )
+                if self.verbose:
+                    print(f"✓ {status}")
+                return status
+
+        if self.verbose:
+            print("✗ No response or invalid response")
         return None
     
     def erase_flash(self) -> bool:
@@ -443,7 +603,7 @@ class CANBootloaderFlash:
             return True
         elif resp.data[0] == RESP_NACK:
             error_code = resp.data[1] if len(resp.data) > 1 else 0
-            error_desc = ERROR_DESCRIPTIONS.get(error_code, f"Error {error_code}")
+            error_desc = error_description(error_code)
             print(f"✗ Erase failed: {error_desc}")
             return False
         else:
@@ -464,12 +624,7 @@ class CANBootloaderFlash:
             print(f"Setting address to 0x{address:08X}...")
         
         # Prepare address bytes (MSB first)
-        addr_bytes = [
-            (address >> 24) & 0xFF,
-            (address >> 16) & 0xFF,
-            (address >> 8) & 0xFF,
-            address & 0xFF
-        ]
+        addr_bytes = address.to_bytes(4, 'big')
         
         # Send SET_ADDRESS command
         if not self.send_command(CMD_SET_ADDRESS, addr_bytes):
@@ -489,48 +644,80 @@ class CANBootloaderFlash:
             return True
         elif resp.data[0] == RESP_NACK:
             error_code = resp.data[1] if len(resp.data) > 1 else 0
-            error_desc = ERROR_DESCRIPTIONS.get(error_code, f"Error {error_code}")
+            error_desc = error_description(error_code)
             if self.verbose:
                 print(f"✗ Failed: {error_desc}")
             return False
         
         return False
     
-    def write_4bytes(self, data: bytes) -> bool:
+    def write_4bytes(self, data: bytes, wait_ack: bool = True) -> bool:
         """
         Write exactly 4 bytes to flash.
         Bootloader buffers two 4-byte chunks before writing 8 bytes to flash.
-        
+
         Args:
             data: Exactly 4 bytes to write
-            
+            wait_ack: Wait for the per-frame ACK (False when pipelining pages)
+
         Returns:
             True if write successful
         """
         if len(data) != 4:
             raise ValueError(f"Must write exactly 4 bytes, got {len(data)}")
-        
-        # Build command: [CMD] [0x04] [byte0] [byte1] [byte2] [byte3]
-        cmd_data = [0x04] + list(data)
-        
-        # Send WRITE_DATA command
-        if not self.send_command(CMD_WRITE_DATA, cmd_data):
+
+        # Fill the data bytes of the prebuilt template and send directly,
+        # skipping send_command's per-call frame assembly
+        self._tx_buf[2:6] = data
+        if not self.driver.send_message(CAN_HOST_ID, bytes(self._tx_buf), is_extended=True):
             return False
-        
+
+        if not wait_ack:
+            return True
+
         # Wait for ACK
         resp = self.wait_response()
-        
+
         if not resp:
             return False
-        
+
         if resp.data[0] == RESP_ACK:
             return True
         elif resp.data[0] == RESP_NACK:
             error_code = resp.data[1] if len(resp.data) > 1 else 0
-            print(f"\n✗ Write failed: {ERROR_DESCRIPTIONS.get(error_code, 'Unknown error')}")
+            print(f"\n✗ Write failed: {error_description(error_code)}")
             return False
-        
+
         return False
+
+    def read_pending_acks(self, expected_count: int, timeout: float = RESPONSE_TIMEOUT) -> int:
+        """
+        Collect ACK responses for a burst of pipelined WRITE_DATA frames.
+
+        Args:
+            expected_count: Number of ACKs expected (one per frame sent)
+            timeout: Maximum total time to wait in seconds
+
+        Returns:
+            Number of ACKs received, or -1 if a NACK was received
+        """
+        ack_count = 0
+        deadline = time.monotonic() + timeout
+
+        while ack_count < expected_count and (remaining := deadline - time.monotonic()) > 0:
+            resp = self.wait_response(timeout=remaining)
+
+            if not resp:
+                break
+
+            if resp.data[0] == RESP_ACK:
+                ack_count += 1
+            elif resp.data[0] == RESP_NACK:
+                error_code = resp.data[1] if len(resp.data) > 1 else 0
+                print(f"\n✗ Write failed: {error_description(error_code)}")
+                return -1
+
+        return ack_count
     
     def read_data(self, address: int, length: int) -> Optional[bytes]:
         """
@@ -547,13 +734,7 @@ class CANBootloaderFlash:
             return None
         
         # Build command: [CMD] [addr3] [addr2] [addr1] [addr0] [length]
-        addr_bytes = [
-            (address >> 24) & 0xFF,
-            (address >> 16) & 0xFF,
-            (address >> 8) & 0xFF,
-            address & 0xFF,
-            length
-        ]
+        addr_bytes = address.to_bytes(4, 'big') + bytes([length])
         
         if not self.send_command(CMD_READ_FLASH, addr_bytes):
             return None
@@ -569,20 +750,19 @@ class CANBootloaderFlash:
         return None
     
     @staticmethod
-    def pad_to_4byte_boundary(data: bytes) -> bytes:
+    def pad_to_8byte_boundary(data: bytes) -> bytes:
         """
-        Pad data to 4-byte boundary (and therefore 8-byte boundary).
-        
+        Pad data to the STM32L4's native 8-byte (64-bit doubleword) flash
+        write width, so the bootloader's 2-chunk buffer never straddles a
+        partial doubleword at the end of the image.
+
         Args:
             data: Original firmware data
-            
+
         Returns:
-            Padded data (length is multiple of 4)
+            Padded data (length is multiple of 8)
         """
-        padding_needed = (4 - len(data) % 4) % 4
-        if padding_needed > 0:
-            data = data + b'\xFF' * padding_needed
-        return data
+        return data + b'\xFF' * ((-len(data)) % 8)
     
     def write_firmware(self, firmware_data: bytes) -> bool:
         """
@@ -603,45 +783,104 @@ class CANBootloaderFlash:
         
         print(f"Total size: {total_bytes} bytes ({total_bytes/1024:.2f} KB)")
         print(f"Chunk size: {chunk_size} bytes per CAN message")
+        print(f"Window size: {WRITE_WINDOW} frames in flight between ACK drains")
         print("Bootloader buffers 2 chunks (8 bytes) before writing to flash")
         print()
-        
-        # Set initial address
+
+        # Set the write address once; the bootloader auto-increments it per
+        # WRITE_DATA frame, so the stream below is pure data frames and
+        # SET_ADDRESS is only re-issued on a NACK rewind
         if not self.set_address(APP_START_ADDRESS):
             print("✗ Failed to set initial address")
             return False
-        
-        # Write data in 4-byte chunks
+
+        # Pad once to a 4-byte multiple
+        if len(firmware_data) % 4:
+            firmware_data = bytes(firmware_data) + b'\xFF' * (4 - len(firmware_data) % 4)
+        fw_view = memoryview(firmware_data)
+
+        # Pre-encode every WRITE_DATA frame once up front. The send loop
+        # just slices this list, and a NACK rewind becomes an index reset
+        # instead of re-encoding payloads from the raw image.
+        tx_buf = self._tx_buf
+        frames = []
+        for (word,) in struct.iter_unpack('<I', fw_view):
+            # Only the data bytes change; CMD and length live in the template
+            struct.pack_into('<I', tx_buf, 2, word)
+            frames.append(CANMessage(
+                id=CAN_HOST_ID,
+                data=bytes(tx_buf),
+                is_extended=True
+            ))
+
+        # Write data in 4-byte chunks with a sliding window of unacked frames
         start_time = time.time()
-        last_progress = -1
+        last_print_time = 0.0
         bytes_written = 0
-        
-        while bytes_written < total_bytes:
-            # Get next 4-byte chunk
-            chunk_end = min(bytes_written + chunk_size, total_bytes)
-            chunk = firmware_data[bytes_written:chunk_end]
-            
-            # Ensure exactly 4 bytes (pad if needed for last chunk)
-            if len(chunk) < 4:
-                chunk = chunk + b'\xFF' * (4 - len(chunk))
-            
-            # Write 4-byte chunk
-            if not self.write_4bytes(chunk):
-                print(f"\n✗ Write failed at offset 0x{bytes_written:08X}")
-                return False
-            
-            bytes_written += len(chunk) if chunk_end != total_bytes or len(chunk) == 4 else (chunk_end - bytes_written)
-            
-            # Update progress every 128 bytes (32 messages)
-            progress = int((bytes_written * 100) / total_bytes)
-            if bytes_written % 128 == 0 or bytes_written >= total_bytes:
-                if progress != last_progress:
-                    elapsed = time.time() - start_time
-                    speed = bytes_written / elapsed / 1024 if elapsed > 0 else 0
-                    eta = (total_bytes - bytes_written) / (bytes_written / elapsed) if elapsed > 0 and bytes_written > 0 else 0
-                    print(f"Progress: {progress:3d}% [{bytes_written}/{total_bytes} bytes] "
-                          f"Speed: {speed:.1f} KB/s ETA: {eta:.1f}s", end='\r')
-                    last_progress = progress
+        frame_index = 0
+        outstanding = 0
+        rewinds = 0
+
+        while frame_index < len(frames) or outstanding:
+            # Top up the window so WRITE_WINDOW frames stay in flight
+            if frame_index < len(frames) and outstanding < WRITE_WINDOW:
+                window = frames[frame_index:frame_index + WRITE_WINDOW - outstanding]
+                sent = self.driver.send_batch(window)
+                if sent != len(window):
+                    print(f"\n✗ Write failed near offset 0x{bytes_written:08X} "
+                          f"(sent {sent}/{len(window)} frames)")
+                    return False
+                frame_index += sent
+                outstanding += sent
+
+            # Drain only half the window while frames remain, so the next
+            # batch transmits while the bootloader is still programming the
+            # previous one; drain everything once the last frame is queued
+            if frame_index >= len(frames):
+                expected = outstanding
+            else:
+                expected = outstanding - WRITE_WINDOW // 2
+            ack_count = self.read_pending_acks(expected)
+            if ack_count != expected:
+                # NACK or missing ACKs: rewind to the last offset the
+                # bootloader confirmed and resume from there
+                if rewinds >= MAX_WRITE_REWINDS:
+                    print(f"\n✗ Write failed near offset 0x{bytes_written:08X} "
+                          f"({ack_count}/{expected} ACKs, rewinds exhausted)")
+                    return False
+                rewinds += 1
+                self._clear_rx_queue()
+                status = self.get_status()
+                if not status:
+                    print("\n✗ Write failed and bootloader status unavailable for rewind")
+                    return False
+                bytes_written = min(status.bytes_written & ~0x3, total_bytes)
+                frame_index = bytes_written // 4
+                outstanding = 0
+                print(f"\n⚠ Rewinding to confirmed offset 0x{bytes_written:08X} "
+                      f"(attempt {rewinds}/{MAX_WRITE_REWINDS})")
+                if not self.set_address(APP_START_ADDRESS + bytes_written):
+                    print("✗ Failed to reset write address after rewind")
+                    return False
+                continue
+
+            outstanding -= ack_count
+            # Clamp to the image size: the last frame may carry pad bytes,
+            # which are not firmware bytes for progress purposes
+            bytes_written = min((frame_index - outstanding) * 4, total_bytes)
+
+            # Repaint progress at most ~10 times/sec so the formatting and
+            # stdio flush stay off the per-window critical path
+            now = time.monotonic()
+            if now - last_print_time > 0.1 or bytes_written >= total_bytes:
+                last_print_time = now
+                progress = int((bytes_written * 100) / total_bytes)
+                elapsed = time.time() - start_time
+                rate = bytes_written / elapsed if elapsed > 0 else 0
+                speed = rate / 1024
+                eta = (total_bytes - bytes_written) / rate if rate > 0 else 0
+                print(f"Progress: {progress:3d}% [{bytes_written}/{total_bytes} bytes] "
+                      f"Speed: {speed:.1f} KB/s ETA: {eta:.1f}s", end='\r')
         
         elapsed = time.time() - start_time
         avg_speed = total_bytes / elapsed / 1024 if elapsed > 0 else 0
@@ -651,6 +890,81 @@ class CANBootloaderFlash:
         
         return True
     
+    def verify_crc(self, expected_data: bytes, address: int = APP_START_ADDRESS) -> Optional[bool]:
+        """
+        Verify flashed data with a single CRC-32 exchange.
+
+        The host computes zlib.crc32 over the (padded) image and asks the
+        bootloader to compute the same CRC over the flashed region. One
+        request/response pair replaces thousands of READ_FLASH round-trips.
+
+        Args:
+            expected_data: Expected binary data
+            address: Flash start address of the region
+
+        Returns:
+            True if CRCs match, False on mismatch, None if the bootloader
+            did not answer (e.g. firmware without CMD_VERIFY_CRC support)
+        """
+        expected_crc = zlib.crc32(expected_data) & 0xFFFFFFFF
+        length = len(expected_data)
+
+        # Build command: [CMD] [addr3..addr0] [len2] [len1] [len0]
+        cmd_data = address.to_bytes(4, 'big') + length.to_bytes(3, 'big')
+
+        if not self.send_command(CMD_VERIFY_CRC, cmd_data):
+            return None
+
+        # The bootloader walks the whole region, so allow extra time
+        resp = self.wait_response(timeout=3.0)
+        if not resp or len(resp.data) < 5 or resp.data[0] != RESP_CRC:
+            return None
+
+        device_crc = int.from_bytes(resp.data[1:5], 'big')
+
+        if device_crc == expected_crc:
+            if self.verbose:
+                print(f"✓ CRC verified: 0x{expected_crc:08X}")
+            return True
+
+        if self.verbose:
+            print(f"✗ CRC mismatch: expected 0x{expected_crc:08X}, device 0x{device_crc:08X}")
+        return False
+
+    @staticmethod
+    def _report_mismatch(address: int, expected, actual):
+        """Format the verify-mismatch diagnostic (off the comparison path)."""
+        print(f"\n✗ Verification failed at address 0x{address:08X}")
+        print(f"  Expected: {bytes(expected).hex()}")
+        print(f"  Read:     {bytes(actual).hex()}")
+
+    def _page_crcs(self, firmware_data: bytes) -> Optional[list]:
+        """
+        Compare per-page CRCs of the flashed region against a new image.
+
+        Queries the bootloader's CRC for each 2KB flash page and compares
+        it with zlib.crc32 over the matching host slice.
+
+        Args:
+            firmware_data: New (padded) firmware image
+
+        Returns:
+            List of byte offsets of pages that differ (empty list means the
+            flashed image is already identical), or None if the bootloader
+            does not support CMD_VERIFY_CRC.
+        """
+        changed = []
+        # Per-page mismatches are expected, not errors - keep them quiet
+        with self._quiet():
+            for offset in range(0, len(firmware_data), FLASH_PAGE_SIZE):
+                page = firmware_data[offset:offset + FLASH_PAGE_SIZE]
+                result = self.verify_crc(page, APP_START_ADDRESS + offset)
+                if result is None:
+                    return None
+                if result is False:
+                    changed.append(offset)
+        return changed
+
     def verify_flash(self, expected_data: bytes) -> bool:
         """
         Verify flashed data by reading back and comparing.
@@ -667,10 +981,11 @@ class CANBootloaderFlash:
         
         address = APP_START_ADDRESS
         bytes_verified = 0
-        chunk_size = 4  # Read 4 bytes at a time for consistency with write
+        chunk_size = 7  # READ_FLASH returns up to 7 bytes per frame - use all of them
+        expected_view = memoryview(expected_data)  # zero-copy chunk slices
         
         start_time = time.time()
-        last_progress = -1
+        last_print_time = 0.0
         
         while bytes_verified < len(expected_data):
             # Read chunk
@@ -683,27 +998,26 @@ class CANBootloaderFlash:
                 print(f"\n✗ Failed to read at address 0x{address:08X}")
                 return False
             
-            # Compare
-            expected_chunk = expected_data[bytes_verified:bytes_verified + read_size]
+            # Compare (bytes == runs in C; diagnostics are only formatted
+            # once a mismatch has already ended the run)
+            expected_chunk = expected_view[bytes_verified:bytes_verified + read_size]
             
             if read_data != expected_chunk:
-                print(f"\n✗ Verification failed at address 0x{address:08X}")
-                print(f"  Expected: {expected_chunk.hex()}")
-                print(f"  Read:     {read_data.hex()}")
+                self._report_mismatch(address, expected_chunk, read_data)
                 return False
             
             bytes_verified += read_size
             address += read_size
             
-            # Update progress every 128 bytes
-            progress = int((bytes_verified * 100) / len(expected_data))
-            if bytes_verified % 128 == 0 or bytes_verified >= len(expected_data):
-                if progress != last_progress:
-                    elapsed = time.time() - start_time
-                    speed = bytes_verified / elapsed / 1024 if elapsed > 0 else 0
-                    print(f"Verifying: {progress:3d}% [{bytes_verified}/{len(expected_data)} bytes] "
-                          f"Speed: {speed:.1f} KB/s", end='\r')
-                    last_progress = progress
+            # Repaint progress at most ~10 times/sec
+            now = time.monotonic()
+            if now - last_print_time > 0.1 or bytes_verified >= len(expected_data):
+                last_print_time = now
+                progress = int((bytes_verified * 100) / len(expected_data))
+                elapsed = time.time() - start_time
+                speed = bytes_verified / elapsed / 1024 if elapsed > 0 else 0
+                print(f"Verifying: {progress:3d}% [{bytes_verified}/{len(expected_data)} bytes] "
+                      f"Speed: {speed:.1f} KB/s", end='\r')
         
         elapsed = time.time() - start_time
         print(f"\n\n✓ Verification successful ({bytes_verified} bytes)")
@@ -736,7 +1050,7 @@ class CANBootloaderFlash:
                 return True
             elif resp.data[0] == RESP_NACK:
                 error_code = resp.data[1] if len(resp.data) > 1 else 0
-                error_desc = ERROR_DESCRIPTIONS.get(error_code, f"Error {error_code}")
+                error_desc = error_description(error_code)
                 print(f"✗ Jump failed: {error_desc}")
                 return False
         else:
@@ -764,8 +1078,14 @@ class CANBootloaderFlash:
         print(f"Loading firmware: {firmware_path.name}")
         print(f"{'='*60}")
         
+        # Memory-map the file instead of reading it into a bytes object;
+        # the write loop then slices the OS page cache directly via
+        # memoryview with no up-front copy
+        fw_mmap = None
         try:
-            firmware_data = firmware_path.read_bytes()
+            with open(firmware_path, 'rb') as fw_file:
+                fw_mmap = mmap.mmap(fw_file.fileno(), 0, access=mmap.ACCESS_READ)
+            firmware_data = memoryview(fw_mmap)
             original_size = len(firmware_data)
 
             # Truncate to APP_MAX_SIZE if larger (last 16KB reserved for permanent storage)
@@ -775,17 +1095,34 @@ class CANBootloaderFlash:
                 firmware_data = firmware_data[:APP_MAX_SIZE]
                 original_size = len(firmware_data)
 
-            # Pad to 4-byte boundary (ensures 8-byte alignment)
-            firmware_data = self.pad_to_4byte_boundary(firmware_data)
+            # Pad to the native 8-byte flash write width. Padding forces a
+            # copy; already-aligned images stay zero-copy views of the mmap
+            if original_size % 8:
+                firmware_data = self.pad_to_8byte_boundary(bytes(firmware_data))
+                fw_mmap.close()
+                fw_mmap = None
 
             print(f"✓ Loaded {original_size} bytes ({original_size/1024:.2f} KB)")
             if len(firmware_data) != original_size:
-                print(f"  Padded to {len(firmware_data)} bytes (4-byte aligned)\n")
+                print(f"  Padded to {len(firmware_data)} bytes (8-byte aligned)\n")
             else:
                 print()
         except Exception as e:
             print(f"✗ Failed to read firmware file: {e}")
+            if fw_mmap is not None:
+                fw_mmap.close()
             return False
+
+        try:
+            return self._flash_loaded_firmware(firmware_data, verify, jump)
+        finally:
+            if fw_mmap is not None:
+                firmware_data.release()
+                fw_mmap.close()
+
+    def _flash_loaded_firmware(self, firmware_data, verify: bool,
+                               jump: bool) -> bool:
+        """Run the erase/write/verify/jump sequence on a loaded image."""
         
         # Get initial status
         status = self.get_status()
@@ -793,19 +1130,42 @@ class CANBootloaderFlash:
             print("⚠ Warning: Could not get bootloader status")
             print("  Continuing anyway...\n")
         
+        # Re-flash fast path: if every 2KB page already matches the new
+        # image, skip the erase and write entirely. The bootloader only
+        # supports whole-region erase, so selectively erasing just the
+        # changed pages is not possible - but identical re-flashes (common
+        # during development) become nearly free.
+        changed_pages = self._page_crcs(firmware_data)
+        if changed_pages is not None:
+            total_pages = -(-len(firmware_data) // FLASH_PAGE_SIZE)
+            if not changed_pages:
+                print(f"✓ All {total_pages} pages already match - skipping erase and write\n")
+                if jump:
+                    if not self.jump_to_application():
+                        print("⚠ Warning: Jump command may have failed")
+                return True
+            print(f"{len(changed_pages)}/{total_pages} pages differ - full erase required\n")
+
         # Erase flash
         if not self.erase_flash():
             return False
-        
+
         # Write firmware
         if not self.write_firmware(firmware_data):
             return False
         
-        # Verify by reading back
+        # Verify: try the single CRC-32 exchange first and only fall back to
+        # the slow per-chunk readback for diagnostics (or old bootloaders)
         if verify:
-            if not self.verify_flash(firmware_data):
-                print("⚠ Warning: Flash verification failed")
-                return False
+            crc_result = self.verify_crc(firmware_data)
+            if crc_result is None:
+                print("⚠ No CRC response from bootloader, falling back to readback verify")
+            elif crc_result is False:
+                print("⚠ CRC mismatch - reading back to locate the first differing address")
+            if crc_result is not True:
+                if not self.verify_flash(firmware_data):
+                    print("⚠ Warning: Flash verification failed")
+                    return False
         
         # Jump to application
         if jump:
@@ -853,6 +1213,11 @@ Examples:
                        help='Stay in bootloader after flashing')
     parser.add_argument('--status-only', action='store_true',
                        help='Only get bootloader status and exit')
+    parser.add_argument('--baudrate', type=int, default=500,
+                       choices=[125, 250, 500, 1000],
+                       help='CAN bitrate in kbps; must match the bootloader bus (default: 500)')
+    parser.add_argument('--fd', action='store_true',
+                       help='Open the adapter in CAN FD mode (bootloader frames stay classic 8-byte)')
     parser.add_argument('--list-devices', action='store_true',
                        help='List available CAN devices and exit')
 
@@ -876,9 +1241,14 @@ Examples:
             if not PCAN_AVAILABLE:
                 print("✗ PCAN driver not available. Install PCAN_Driver.py")
                 return 1
+            try:
+                from PCAN_Driver import PCANDriver
+            except ImportError as e:
+                print(f"✗ PCAN driver not available ({e})")
+                return 1
             driver = PCANDriver()
             print("Scanning for PCAN devices...\n")
-            devices = driver.get_available_devices()
+            devices = _cached_devices('pcan', driver)
 
             if not devices:
                 print("✗ No PCAN devices found")
@@ -893,9 +1263,14 @@ Examples:
             if not CANABLE_AVAILABLE:
                 print("✗ CANable driver not available. Install CANable_Driver.py")
                 return 1
+            try:
+                from CANable_Driver import CANableDriver
+            except ImportError as e:
+                print(f"✗ CANable driver not available ({e})")
+                return 1
             driver = CANableDriver()
             print("Scanning for CANable devices...\n")
-            devices = driver.get_available_devices()
+            devices = _cached_devices('canable', driver)
 
             if not devices:
                 print("✗ No CANable devices found")
@@ -927,14 +1302,16 @@ Examples:
             if not PCAN_AVAILABLE:
                 print("✗ PCAN driver not available. Install PCAN_Driver.py and python-can")
                 return 1
-            adapter = PCANAdapter(args.channel)
+            adapter = PCANAdapter(args.channel, fd_mode=args.fd,
+                                  baudrate_kbps=args.baudrate)
             adapter_name = f"PCAN {args.channel}"
         elif args.adapter == 'canable':
             if not CANABLE_AVAILABLE:
                 print("✗ CANable driver not available. Install CANable_Driver.py and python-can")
                 return 1
             channel_index = int(args.channel)
-            adapter = CANableAdapter(channel_index)
+            adapter = CANableAdapter(channel_index, fd_mode=args.fd,
+                                     baudrate_kbps=args.baudrate)
             adapter_name = f"CANable device {channel_index}"
         else:
             print(f"✗ Unknown adapter type: {args.adapter}")
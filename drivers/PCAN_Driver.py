@@ -64,6 +64,10 @@ class PCANChannel(Enum):
     USB16 = PCAN_USBBUS16
 
 
+# Valid channel names, computed once at import for O(1) membership checks
+PCAN_CHANNEL_NAMES = frozenset(c.name for c in PCANChannel)
+
+
 class PCANMessageType(Enum):
     """CAN message types"""
     STANDARD = PCAN_MESSAGE_STANDARD
@@ -127,6 +131,9 @@ class PCANDriver:
         self._receive_callback: Optional[Callable[[CANMessage], None]] = None
         self._stop_receive: bool = False
         self._pcan_basic = PCANBasic()
+        # Persistent TX frame structure, registered once and reused by every
+        # direct PCANBasic write (the ctypes analogue of a registered buffer)
+        self._tx_msg = TPCANMsg()
         
     def get_available_devices(self) -> List[dict]:
         """
@@ -307,7 +314,100 @@ class PCANDriver:
         except Exception as e:
             print(f"✗ Failed to send message: {str(e)}")
             return False
-    
+
+    def send_batch(self, messages: List[CANMessage]) -> int:
+        """
+        Send multiple CAN messages back-to-back in one tight loop.
+
+        Avoids the per-call overhead of send_message() when streaming many
+        frames (e.g. firmware flashing).
+
+        Args:
+            messages: List of CANMessage objects to send in order.
+
+        Returns:
+            Number of messages successfully queued for transmission.
+        """
+        if not self._is_connected:
+            print("✗ Not connected to PCAN device")
+            return 0
+
+        # Fast path: write through PCANBasic directly with one reused
+        # TPCANMsg, skipping python-can Message construction per frame.
+        # _send_batch_basic only raises before its write loop starts
+        # (setup/attribute failures); once frames are on the bus it
+        # reports its partial count instead, so the fallback below can
+        # never re-send frames that were already transmitted (duplicates
+        # would corrupt auto-incrementing write streams while flashing).
+        try:
+            return self._send_batch_basic(messages)
+        except Exception:
+            pass  # Nothing sent yet - fall back to the python-can path below
+
+        bus_send = self._bus.send
+        sent = 0
+        try:
+            for msg in messages:
+                bus_send(Message(
+                    arbitration_id=msg.id,
+                    data=msg.data,
+                    is_extended_id=msg.is_extended,
+                    is_remote_frame=msg.is_remote
+                ))
+                sent += 1
+        except Exception as e:
+            print(f"✗ Batch send failed after {sent} messages: {str(e)}")
+
+        return sent
+
+    def _send_batch_basic(self, messages: List[CANMessage]) -> int:
+        """
+        Batch-send classic CAN frames via PCANBasic CAN_Write directly.
+
+        Reuses the driver's persistent TPCANMsg structure, so the
+        inner loop is just field stores plus one ctypes call per frame -
+        the closest Python gets to a tight C write loop without a
+        compiled extension.
+
+        Args:
+            messages: List of CANMessage objects (DLC <= 8).
+
+        Returns:
+            Number of messages accepted by the driver. Only raises before
+            the first frame is written; once transmission has started,
+            failures stop the loop and the partial count is returned.
+        """
+        # Anything that can raise without a frame on the bus (missing
+        # attributes, no PCANBasic handle) happens here, before the loop;
+        # per-frame failures below return the partial count instead of
+        # raising so the caller never re-sends what already went out
+        channel = self._channel.value
+        pcan_write = self._pcan_basic.Write
+        msg = self._tx_msg
+        sent = 0
+
+        for m in messages:
+            try:
+                data = m.data
+                msg.ID = m.id
+                msg.LEN = len(data)
+                msg.MSGTYPE = ((PCAN_MESSAGE_EXTENDED.value if m.is_extended
+                                else PCAN_MESSAGE_STANDARD.value) |
+                               (PCAN_MESSAGE_RTR.value if m.is_remote else 0))
+                for i in range(len(data)):
+                    msg.DATA[i] = data[i]
+                status = pcan_write(channel, msg)
+            except Exception as e:
+                print(f"✗ Batch send failed after {sent} messages: {str(e)}")
+                break
+
+            if status != PCAN_ERROR_OK:
+                print(f"✗ Batch send failed after {sent} messages (CAN_Write error)")
+                break
+            sent += 1
+
+        return sent
+
     def read_message(self, timeout: float = 1.0) -> Optional[CANMessage]:
         """
         Read a CAN message from the bus.